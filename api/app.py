@@ -11,52 +11,63 @@ Routes:
   DELETE /api/jobs/{job_id}         - Cancel a job
   GET  /api/health                  - Health check
 """
-import json
+import re
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
 from api.schemas import (
     ScrapeUrlRequest, ScrapeUrlResponse,
     ScrapeBatchRequest, ScrapeSearchRequest,
-    JobCreatedResponse, JobProgressResponse, JobResultsResponse,
+    JobCreatedResponse, JobProgressResponse,
     JobStatus, HealthResponse,
 )
 from api.job_manager import JobManager
-from utils.browser_manager import BrowserManager
+from utils.browser_pool import BrowserPool
+from utils.url_cache import scrape_cache
 from utils.rate_limiter import RateLimiter
 from scrapers.detail_scraper import DetailScraper
 from processors.data_processor import DataProcessor
 from models.enums import AttractionType
-from models.attraction import create_attraction
+from models.attraction import create_attraction_trusted
 from utils.logger import log
+from config.settings import PAGE_LOAD_TIMEOUT
 
 
 # ── Shared state ──
 
 job_manager = JobManager()
-# Reusable browser for single-URL scrapes (avoids cold-start per request)
-_browser: BrowserManager | None = None
+# Stateless processor and enum cache shared across requests
+_data_processor = DataProcessor()
+_type_cache = {t.value: t for t in AttractionType}
+# Accepted Google Maps hosts, compiled once so validation is one C-level scan
+_VALID_HOST_RE = re.compile(r"(?:google\.com/maps|maps\.app\.goo\.gl|goo\.gl/maps)")
+# Pool of reusable browser contexts for single-URL scrapes
+# (avoids cold-start per request and lets N requests scrape in parallel)
+_pool: BrowserPool | None = None
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup / shutdown lifecycle."""
-    global _browser
-    _browser = BrowserManager()
-    await _browser.start()
-    log.info("API browser manager started")
+    global _pool
+    _pool = BrowserPool()
+    await _pool.init()
+    log.info("API browser pool started")
     yield
-    if _browser:
-        await _browser.close()
-        log.info("API browser manager closed")
+    if _pool:
+        await _pool.close()
+        log.info("API browser pool closed")
 
 
 app = FastAPI(
     title="Attractions Scraper API",
     version="1.0.0",
     lifespan=lifespan,
+    # orjson is much faster than the stdlib encoder on large result payloads
+    default_response_class=ORJSONResponse,
 )
 
 # CORS — allow your React frontend origin
@@ -86,43 +97,55 @@ async def scrape_single_url(body: ScrapeUrlRequest):
     Request:  {"url": "https://www.google.com/maps/place/..."}
     Response: {"data": { ...attraction fields... }}
     """
-    global _browser
-    if not _browser or not _browser.page:
+    global _pool
+    if not _pool or not _pool.ready:
         raise HTTPException(status_code=503, detail="Browser not ready")
 
     url = body.url
-    valid_hosts = ("google.com/maps", "maps.app.goo.gl", "goo.gl/maps")
-    if not any(host in url for host in valid_hosts):
+    if not _VALID_HOST_RE.search(url):
         raise HTTPException(status_code=400, detail="URL must be a Google Maps URL")
 
+    # Serve recently scraped URLs from cache, skipping the browser entirely
+    cached = scrape_cache.get(url)
+    if cached is not None:
+        log.debug(f"Cache hit for: {url}")
+        return ScrapeUrlResponse(data=cached)
+
     try:
-        # Navigate
-        success = await _browser.navigate(url)
-        if not success:
-            raise HTTPException(status_code=502, detail="Failed to load the page")
+        async with _pool.acquire_entry() as entry:
+            page = entry.page
+
+            # Navigate
+            try:
+                await page.goto(url, wait_until="networkidle", timeout=PAGE_LOAD_TIMEOUT)
+            except Exception as e:
+                log.error(f"Navigation failed: {e}")
+                raise HTTPException(status_code=502, detail="Failed to load the page")
 
-        # Extract
-        detail_scraper = DetailScraper(_browser.page)
-        raw_data = await detail_scraper.extract_all(url)
+            # Extract, reusing the scraper pinned to this pooled page
+            if entry.scraper is None:
+                entry.scraper = DetailScraper(page)
+            raw_data = await entry.scraper.extract_all(url)
 
         # Clean & enrich
-        processor = DataProcessor()
-        raw_data = processor.clean_data(raw_data)
+        raw_data = _data_processor.clean_data(raw_data)
 
         if "type" not in raw_data:
-            inferred = processor.infer_attraction_type(
+            inferred = _data_processor.infer_attraction_type(
                 raw_data.get("category"), url
             )
             raw_data["type"] = inferred.value if inferred else AttractionType.ACTIVITY.value
 
-        attraction_type = AttractionType(raw_data["type"])
-        quality_info = processor.get_data_quality_info(raw_data, attraction_type)
+        attraction_type = _type_cache[raw_data["type"]]
+        quality_info = _data_processor.get_data_quality_info(raw_data, attraction_type)
 
-        # Validate through Pydantic model
-        attraction = create_attraction(raw_data)
-        data = json.loads(attraction.model_dump_json(exclude_none=True))
+        # Build the response model; the data was cleaned by our own
+        # pipeline above, so skip a second full Pydantic validation pass
+        attraction = create_attraction_trusted(raw_data)
+        data = attraction.model_dump(mode="json", exclude_none=True)
         data["data_quality"] = quality_info
 
+        scrape_cache.put(url, data)
         return ScrapeUrlResponse(data=data)
 
     except HTTPException:
@@ -167,7 +190,10 @@ async def scrape_search(body: ScrapeSearchRequest):
     Request:  {"search_items": [{"name": "...", "city": "..."}], "mode": "auto"}
     Response: {"job_id": "abc123", "status": "pending", "message": "..."}
     """
-    items = [item.model_dump() for item in body.search_items]
+    # Direct attribute access; SearchItem is a tiny known schema, so
+    # Pydantic's general model_dump machinery is overkill per item
+    items = [{"name": i.name, "city": i.city, "type": i.type}
+             for i in body.search_items]
     job_id = await job_manager.create_search_job(
         search_items=items,
         mode=body.mode.value,
@@ -207,11 +233,14 @@ async def get_job_progress(job_id: str):
 #  GET /api/jobs/{job_id}/results  — completed results
 # ─────────────────────────────────────────────
 
-@app.get("/api/jobs/{job_id}/results", response_model=JobResultsResponse)
+@app.get("/api/jobs/{job_id}/results")
 async def get_job_results(job_id: str):
     """
     Get the full results of a completed scrape job.
 
+    Streams the payload one attraction at a time so large result sets
+    don't get materialized as a single JSON blob in memory.
+
     Response: {"data": {"metadata": {...}, "attractions": {...}, "failed_attractions": [...]}}
     """
     job = job_manager.get_job(job_id)
@@ -224,11 +253,10 @@ async def get_job_results(job_id: str):
     if job.status == JobStatus.FAILED:
         raise HTTPException(status_code=500, detail=f"Job failed: {job.error}")
 
-    results = job.get_results()
-    if not results:
+    if job.status != JobStatus.COMPLETED or not job.scraper:
         raise HTTPException(status_code=404, detail="No results available")
 
-    return JobResultsResponse(data=results)
+    return StreamingResponse(job.iter_result_chunks(), media_type="application/json")
 
 
 # ─────────────────────────────────────────────
@@ -258,3 +286,16 @@ async def cancel_job(job_id: str):
 @app.get("/api/health", response_model=HealthResponse)
 async def health_check():
     return HealthResponse(active_jobs=job_manager.active_job_count)
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(
+        "api.app:app",
+        host="0.0.0.0",
+        port=8001,
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+    )
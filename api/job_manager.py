@@ -3,37 +3,60 @@ Manages background scraping jobs with progress tracking.
 """
 import asyncio
 import uuid
-import json
-import tempfile
-from pathlib import Path
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Iterator, List, Optional
+
+import orjson
 
 from api.schemas import JobStatus
 from main import AttractionsScraper
 from processors.data_processor import DataProcessor
 from models.enums import AttractionType
 from utils.logger import log
-from config.settings import INPUT_DIR
+
+
+# Shared across requests: DataProcessor is stateless, and the enum cache
+# avoids re-validating AttractionType(str) once per attraction
+_DATA_PROCESSOR = DataProcessor()
+_TYPE_CACHE = {t.value: t for t in AttractionType}
+
+# Cap on jobs kept in the registry; oldest finished jobs are evicted first
+MAX_TRACKED_JOBS = 1000
+
+# Statuses that can no longer change
+_TERMINAL_STATUSES = (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
 
 
 class ScrapeJob:
     """Tracks the state of a single scrape job."""
 
-    def __init__(self, job_id: str, input_file: str, mode: str = "manual",
-                 output_filename: str = None):
+    # Slots instead of a per-instance __dict__; the registry can hold
+    # up to MAX_TRACKED_JOBS of these
+    __slots__ = ("job_id", "mode", "output_filename", "urls", "search_items",
+                 "status", "error", "created_at", "task", "scraper",
+                 "_cached_progress")
+
+    def __init__(self, job_id: str, mode: str = "manual",
+                 output_filename: str = None,
+                 urls: List[str] = None, search_items: List[Dict] = None):
         self.job_id = job_id
-        self.input_file = input_file
         self.mode = mode
         self.output_filename = output_filename
+        self.urls = urls or []
+        self.search_items = search_items or []
         self.status = JobStatus.PENDING
         self.error: Optional[str] = None
         self.created_at = datetime.now().isoformat()
         self.task: Optional[asyncio.Task] = None
         self.scraper: Optional[AttractionsScraper] = None
+        self._cached_progress: Optional[Dict] = None
 
     def get_progress(self) -> Dict:
         """Get current job progress from the scraper's output processor."""
+        # Terminal jobs can't change; reuse the last computed snapshot
+        if self._cached_progress is not None:
+            return self._cached_progress
+
         progress = {
             "job_id": self.job_id,
             "status": self.status,
@@ -53,6 +76,9 @@ class ScrapeJob:
             progress["failed"] = stats["failed"]
             progress["by_type"] = stats["by_type"]
 
+        if self.status in _TERMINAL_STATUSES:
+            self._cached_progress = progress
+
         return progress
 
     def get_results(self) -> Optional[Dict]:
@@ -64,14 +90,13 @@ class ScrapeJob:
         data = self.scraper.output_processor.data
 
         # Serialize attractions grouped by type, with data quality info
-        processor = DataProcessor()
         attractions = {}
         for type_key, type_attractions in data.attractions.items():
             serialized = []
             for a in type_attractions:
-                entry = json.loads(a.model_dump_json(exclude_none=True))
-                attraction_type = AttractionType(a.type)
-                entry["data_quality"] = processor.get_data_quality_info(entry, attraction_type)
+                entry = a.model_dump(mode="json", exclude_none=True)
+                attraction_type = _TYPE_CACHE[a.type]
+                entry["data_quality"] = _DATA_PROCESSOR.get_data_quality_info(entry, attraction_type)
                 serialized.append(entry)
             attractions[type_key] = serialized
 
@@ -84,29 +109,79 @@ class ScrapeJob:
             "failed_attractions": data.failed_attractions,
         }
 
+    def iter_result_chunks(self) -> Iterator[bytes]:
+        """
+        Yield the results payload as JSON byte chunks.
+
+        Serializes one attraction at a time so peak memory stays O(1
+        attraction) and the first bytes hit the wire before the full
+        payload is encoded. Produces the same shape as get_results,
+        wrapped in {"data": ...}.
+
+        Deliberately a sync generator: Starlette drives sync iterators
+        through its threadpool (iterate_in_threadpool), so the
+        model_dump/data-quality CPU for large jobs runs off the event
+        loop and doesn't starve other requests.
+        """
+        stats = self.scraper.output_processor.get_stats()
+        data = self.scraper.output_processor.data
+
+        metadata = {
+            "scraped_at": datetime.now().isoformat(),
+            **stats,
+        }
+
+        yield b'{"data":{"metadata":' + orjson.dumps(metadata)
+
+        yield b',"attractions":{'
+        first_group = True
+        for type_key, type_attractions in data.attractions.items():
+            yield (b'' if first_group else b',') + orjson.dumps(type_key) + b':['
+            first_group = False
+
+            first_entry = True
+            for a in type_attractions:
+                entry = a.model_dump(mode="json", exclude_none=True)
+                attraction_type = _TYPE_CACHE[a.type]
+                entry["data_quality"] = _DATA_PROCESSOR.get_data_quality_info(entry, attraction_type)
+                yield (b'' if first_entry else b',') + orjson.dumps(entry)
+                first_entry = False
+
+            yield b']'
+        yield b'}'
+
+        yield b',"failed_attractions":' + orjson.dumps(data.failed_attractions)
+        yield b'}}'
+
 
 class JobManager:
     """Manages all scrape jobs."""
 
     def __init__(self):
         self.jobs: Dict[str, ScrapeJob] = {}
+        self._active_count = 0
 
-    def _write_temp_input(self, content: str, suffix: str = ".txt") -> str:
-        """Write input data to a temp file and return its path."""
-        INPUT_DIR.mkdir(parents=True, exist_ok=True)
-        tmp = INPUT_DIR / f"api_input_{uuid.uuid4().hex[:8]}{suffix}"
-        tmp.write_text(content, encoding="utf-8")
-        return str(tmp)
+    def _register(self, job: ScrapeJob):
+        """Track a new job, evicting the oldest finished jobs past the cap."""
+        self.jobs[job.job_id] = job
+        self._active_count += 1
+
+        if len(self.jobs) > MAX_TRACKED_JOBS:
+            # Dicts iterate in insertion order, so this drops oldest first
+            for job_id, old_job in list(self.jobs.items()):
+                if len(self.jobs) <= MAX_TRACKED_JOBS:
+                    break
+                if old_job.status in _TERMINAL_STATUSES:
+                    del self.jobs[job_id]
 
     async def create_url_batch_job(self, urls: list[str],
                                    output_filename: str = None) -> str:
         """Create a job that scrapes a list of URLs."""
         job_id = uuid.uuid4().hex[:12]
-        input_file = self._write_temp_input("\n".join(urls), suffix=".txt")
 
-        job = ScrapeJob(job_id, input_file, mode="manual",
-                        output_filename=output_filename)
-        self.jobs[job_id] = job
+        job = ScrapeJob(job_id, mode="manual",
+                        output_filename=output_filename, urls=urls)
+        self._register(job)
 
         job.task = asyncio.create_task(self._run_job(job))
         return job_id
@@ -117,19 +192,10 @@ class JobManager:
         """Create a job that searches and scrapes attractions."""
         job_id = uuid.uuid4().hex[:12]
 
-        # Write search items as CSV
-        lines = ["name,city,type"]
-        for item in search_items:
-            name = item.get("name", "")
-            city = item.get("city", "")
-            atype = item.get("type", "")
-            lines.append(f"{name},{city},{atype}")
-
-        input_file = self._write_temp_input("\n".join(lines), suffix=".csv")
-
-        job = ScrapeJob(job_id, input_file, mode=mode,
-                        output_filename=output_filename)
-        self.jobs[job_id] = job
+        job = ScrapeJob(job_id, mode=mode,
+                        output_filename=output_filename,
+                        search_items=search_items)
+        self._register(job)
 
         job.task = asyncio.create_task(self._run_job(job))
         return job_id
@@ -141,9 +207,10 @@ class JobManager:
             log.info(f"Job {job.job_id}: starting scrape")
 
             job.scraper = AttractionsScraper(
-                input_file=job.input_file,
                 output_file=job.output_filename,
                 mode=job.mode,
+                urls=job.urls,
+                search_items=job.search_items,
             )
             await job.scraper.run()
 
@@ -158,11 +225,7 @@ class JobManager:
             job.error = str(e)
             log.error(f"Job {job.job_id}: failed - {e}")
         finally:
-            # Clean up temp input file
-            try:
-                Path(job.input_file).unlink(missing_ok=True)
-            except Exception:
-                pass
+            self._active_count -= 1
 
     def get_job(self, job_id: str) -> Optional[ScrapeJob]:
         return self.jobs.get(job_id)
@@ -181,5 +244,4 @@ class JobManager:
 
     @property
     def active_job_count(self) -> int:
-        return sum(1 for j in self.jobs.values()
-                   if j.status in (JobStatus.PENDING, JobStatus.RUNNING))
+        return self._active_count
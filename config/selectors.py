@@ -2,6 +2,9 @@
 CSS and XPath selectors for Google Maps elements.
 Note: Google Maps frequently changes its DOM structure, so these selectors may need updates.
 """
+import re
+
+from config.settings import HEBREW_KEYWORDS
 
 # Main attraction information
 SELECTORS = {
@@ -181,8 +184,25 @@ SELECTORS = {
     },
 }
 
-# Regex patterns for data extraction
-PATTERNS = {
+# Flat "primary then fallbacks" tuples so scrapers walk a single tuple
+# instead of doing two dict lookups plus a list build per field
+SELECTORS_FLAT = {
+    key: (config["primary"], *config.get("fallback", []))
+    for key, config in SELECTORS.items()
+}
+
+# Comma-joined CSS selector per field; a single query matches whichever
+# of primary/fallbacks exists, in one browser-native traversal
+SELECTORS_COMBINED = {
+    key: ", ".join(selectors)
+    for key, selectors in SELECTORS_FLAT.items()
+}
+
+# XPath selectors by field, for call sites that need the XPath variant
+XPATHS = {key: config["xpath"] for key, config in SELECTORS.items()}
+
+# Regex patterns for data extraction (compiled once at import below)
+_PATTERNS_RAW = {
     # Extract coordinates from URL: /@32.0877788,34.7803984,15z
     "coordinates_url": r"/@(-?\d+\.\d+),(-?\d+\.\d+),(\d+)z",
 
@@ -207,6 +227,9 @@ PATTERNS = {
     "reviews": r"([\d,]+)\s*(?:reviews?|ביקורות)",
 }
 
+# Pre-compiled Pattern objects so hot paths skip re's per-call cache lookup
+PATTERNS = {key: re.compile(pattern) for key, pattern in _PATTERNS_RAW.items()}
+
 # Hebrew day names mapping
 HEBREW_DAYS = {
     "ראשון": "Sunday",
@@ -225,6 +248,40 @@ HEBREW_DAYS = {
     "שבת": "Saturday",
 }
 
+# Single alternation regex so day detection is one pass instead of
+# one substring check per Hebrew day name
+HEBREW_DAYS_RE = re.compile("|".join(map(re.escape, HEBREW_DAYS)))
+
+# Single-pass scanner over every Hebrew day name and keyword. One compiled
+# alternation (longest words first, so "אחר הצהריים" beats "צהריים") replaces
+# the O(days x keywords) substring checks per text block.
+_SCAN_WORDS = {}
+for _hebrew, _english in HEBREW_DAYS.items():
+    _SCAN_WORDS[_hebrew] = ("day", _english)
+for _category, _words in HEBREW_KEYWORDS.items():
+    for _word in _words:
+        _SCAN_WORDS[_word] = ("keyword", _category)
+
+_SCAN_RE = re.compile("|".join(
+    map(re.escape, sorted(_SCAN_WORDS, key=len, reverse=True))))
+
+
+def scan_hebrew(text):
+    """
+    Scan text for Hebrew day names and keywords in a single pass.
+
+    Args:
+        text: Input text string
+
+    Returns:
+        List of (kind, value) tuples, e.g. ('day', 'Sunday') or
+        ('keyword', 'free'), in order of appearance
+    """
+    if not text:
+        return []
+    return [_SCAN_WORDS[match] for match in _SCAN_RE.findall(text)]
+
+
 # English to Hebrew day names (for search queries)
 ENGLISH_TO_HEBREW_DAYS = {
     "Sunday": "ראשון",
@@ -9,6 +9,8 @@ BASE_DIR = Path(__file__).parent.parent
 INPUT_DIR = BASE_DIR / "input"
 OUTPUT_DIR = BASE_DIR / "output"
 LOGS_DIR = BASE_DIR / "logs"
+# Persistent Chromium profile (HTTP cache, cookies) for BrowserManager
+USER_DATA_DIR = BASE_DIR / ".browser_profile"
 
 # Google Maps settings
 GOOGLE_MAPS_BASE_URL = "https://www.google.com/maps"
@@ -21,12 +23,29 @@ VIEWPORT_HEIGHT = 1080
 LOCALE = "he-IL"
 TIMEZONE = "Asia/Jerusalem"
 
+# Browser pool settings (API single-URL scrapes)
+BROWSER_POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "4"))
+BROWSER_POOL_MAX_USES = 50  # Recycle a context after this many scrapes
+BROWSER_POOL_MAX_AGE_MS = 10 * 60 * 1000  # Recycle a context older than this
+
+# Number of concurrent scrape workers per batch job
+SCRAPE_CONCURRENCY = int(os.getenv("SCRAPE_CONCURRENCY", "3"))
+
+# Scraped-URL result cache
+URL_CACHE_SIZE = int(os.getenv("URL_CACHE_SIZE", "10000"))
+URL_CACHE_TTL = int(os.getenv("URL_CACHE_TTL", "3600"))  # seconds
+
+# (city, type) search result cache
+SEARCH_CACHE_SIZE = int(os.getenv("SEARCH_CACHE_SIZE", "1000"))
+SEARCH_CACHE_TTL = int(os.getenv("SEARCH_CACHE_TTL", "86400"))  # seconds
+
 # Rate limiting settings
 BASE_DELAY_MIN = 1.0  # Minimum delay between requests (seconds)
 BASE_DELAY_MAX = 3.0  # Maximum delay between requests (seconds)
 LONG_PAUSE_INTERVAL = 15  # Make a long pause every N requests
 LONG_PAUSE_MIN = 8  # Minimum long pause duration (seconds)
 LONG_PAUSE_MAX = 15  # Maximum long pause duration (seconds)
+RATE_LIMIT_BURST = 3  # Token-bucket capacity (requests that may burst)
 
 # Retry settings
 MAX_RETRIES = 3
@@ -38,6 +57,11 @@ PAGE_LOAD_TIMEOUT = 30000  # Page load timeout (milliseconds)
 ELEMENT_WAIT_TIMEOUT = 5000  # Element wait timeout (milliseconds)
 NETWORK_IDLE_TIMEOUT = 5000  # Network idle timeout (milliseconds)
 
+# Block image/media/font downloads in pooled contexts. The scrapers only
+# read DOM text and src attributes, so skipping the bytes cuts most of the
+# per-page transfer; off by default since screenshots look broken with it
+BLOCK_HEAVY_RESOURCES = os.getenv("BLOCK_HEAVY_RESOURCES", "false").lower() == "true"
+
 # Scraping settings
 MAX_IMAGES = 10  # Maximum number of images to extract
 MAX_SEARCH_RESULTS = 20  # Maximum search results to process per query
@@ -47,6 +71,7 @@ SCREENSHOT_ON_ERROR = True  # Capture screenshot on errors
 OUTPUT_FORMAT = "json"
 CHECKPOINT_ENABLED = True  # Enable checkpoint saving
 CHECKPOINT_INTERVAL = 1  # Save checkpoint after every N attractions
+PRETTY_OUTPUT = os.getenv("PRETTY_OUTPUT", "false").lower() == "true"  # Indent individual JSON files
 
 # Logging settings
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
@@ -56,12 +81,12 @@ LOG_ROTATION = "10 MB"
 LOG_RETENTION = "1 week"
 
 # User agent settings
-USER_AGENTS = [
+USER_AGENTS = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15",
-]
+)
 
 # Hebrew language settings
 ACCEPT_LANGUAGE = "he-IL,he;q=0.9,en;q=0.8"
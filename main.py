@@ -6,51 +6,56 @@ import argparse
 import sys
 from pathlib import Path
 from tqdm import tqdm
+from tqdm.asyncio import tqdm as atqdm
 from utils.logger import log
-from utils.browser_manager import BrowserManager
+from utils.browser_pool import BrowserPool, navigate
 from utils.rate_limiter import RateLimiter
+from utils.url_cache import scrape_cache
 from scrapers.detail_scraper import DetailScraper
 from scrapers.search_scraper import SearchScraper
 from processors.input_processor import InputProcessor
 from processors.output_processor import OutputProcessor
 from processors.data_processor import DataProcessor
-from models.enums import AttractionType
-from config.settings import SCREENSHOT_ON_ERROR, OUTPUT_DIR
+from models.attraction import coerce_attraction_type
+from config.settings import SCREENSHOT_ON_ERROR, OUTPUT_DIR, SCRAPE_CONCURRENCY
 
 
 class AttractionsScraper:
     """Main scraper orchestration class."""
 
-    def __init__(self, input_file: str, output_file: str = None, mode: str = "manual"):
+    def __init__(self, input_file: str = None, output_file: str = None,
+                 mode: str = "manual", urls: list = None, search_items: list = None):
         self.input_file = input_file
         self.output_file = output_file
         self.mode = mode
 
-        self.browser_manager = None
+        self.browser_pool = None
         self.rate_limiter = RateLimiter()
         self.input_processor = InputProcessor()
         self.output_processor = OutputProcessor(output_file)
         self.data_processor = DataProcessor()
 
-        self.urls_queue = []
-        self.search_queue = []
+        # Pre-parsed input (e.g. from the API) skips the input file entirely
+        self.urls_queue = list(urls) if urls else []
+        self.search_queue = list(search_items) if search_items else []
 
     async def run(self):
         """Main execution flow."""
         log.info("Starting Google Maps attractions scraper...")
 
-        # Process input file
-        self._load_input()
+        try:
+            # Process input file off the event loop; file reads are blocking
+            # and large inputs would stall concurrent tasks
+            await asyncio.to_thread(self._load_input)
 
-        if not self.urls_queue and not self.search_queue:
-            log.error("No attractions to scrape. Check your input file.")
-            return
+            if not self.urls_queue and not self.search_queue:
+                log.error("No attractions to scrape. Check your input file.")
+                return
 
-        # Start browser
-        self.browser_manager = BrowserManager()
-        await self.browser_manager.start()
+            # Start browser pool (one context per concurrent worker)
+            self.browser_pool = BrowserPool(max_size=SCRAPE_CONCURRENCY)
+            await self.browser_pool.init()
 
-        try:
             # Process search queries if in auto mode
             if self.search_queue:
                 await self._process_search_queue()
@@ -59,73 +64,99 @@ class AttractionsScraper:
             if self.urls_queue:
                 await self._process_url_queue()
 
-            # Finalize output
-            output_path = self.output_processor.finalize()
+            # Finalize output (disk writes, off the event loop)
+            output_path = await asyncio.to_thread(self.output_processor.finalize)
             if output_path:
                 log.info(f"✅ Scraping complete! Output saved to: {output_path}")
 
                 # Write error log if there are failures
                 if self.output_processor.data.failed_attractions:
-                    self.output_processor.write_error_log()
+                    await asyncio.to_thread(self.output_processor.write_error_log)
 
                 # Print summary
                 self._print_summary()
 
         finally:
-            # Close browser
-            await self.browser_manager.close()
+            # Stop the output writer thread even when the run failed or
+            # was cancelled, so queued records land on disk and the
+            # processor (and its data) can be garbage collected
+            await asyncio.to_thread(self.output_processor.close)
+
+            # Close browser pool
+            if self.browser_pool:
+                await self.browser_pool.close()
 
     def _load_input(self):
         """Load and process input file."""
-        log.info(f"Loading input from: {self.input_file}")
-
-        urls, search_items = self.input_processor.process_file(self.input_file)
+        if not self.input_file:
+            # Queues were handed over in-memory; nothing to parse
+            log.info(f"Using in-memory input: {len(self.urls_queue)} URLs and "
+                     f"{len(self.search_queue)} search items")
+            return
 
-        # Add URLs to queue
-        self.urls_queue.extend(urls)
+        log.info(f"Loading input from: {self.input_file}")
 
-        # Process search items
-        if search_items:
-            # Convert search items to URLs (search Google Maps for each)
-            self.search_queue.extend(search_items)
+        # Consume the streaming parser directly into the queues, so no
+        # intermediate per-format lists are materialized
+        for kind, item in self.input_processor.iter_items(self.input_file):
+            if kind == 'url':
+                self.urls_queue.append(item)
+            else:
+                self.search_queue.append(item)
 
         log.info(f"Loaded {len(self.urls_queue)} URLs and {len(self.search_queue)} search items")
 
     async def _process_search_queue(self):
-        """Process search queue to find attraction URLs."""
+        """Process search queue with bounded concurrent searches."""
         log.info(f"Processing {len(self.search_queue)} search items...")
 
-        search_scraper = SearchScraper(self.browser_manager.page)
+        semaphore = asyncio.Semaphore(SCRAPE_CONCURRENCY)
 
-        for search_item in tqdm(self.search_queue, desc="Searching attractions"):
+        async def bounded_search(search_item):
+            name = search_item.get('name', '')
+            city = search_item.get('city', '')
             try:
-                name = search_item.get('name', '')
-                city = search_item.get('city', '')
-
-                # Search for the attraction
-                search_query = f"{name}, {city}" if city else name
-                urls = await search_scraper.search_attractions(city, name)
-
-                if urls:
-                    # Take the first result (most relevant)
-                    self.urls_queue.append(urls[0])
-                    log.info(f"Found URL for '{search_query}': {urls[0]}")
-                else:
-                    log.warning(f"No results found for: {search_query}")
-                    self.output_processor.add_failed_attraction(search_query, "Not found in search")
-
-                # Rate limiting
-                await self.rate_limiter.wait()
-
+                async with semaphore:
+                    await self.rate_limiter.wait()
+                    async with self.browser_pool.acquire() as page:
+                        return await SearchScraper(page).search_attractions(city, name)
             except Exception as e:
-                log.error(f"Search failed for {search_item}: {e}")
-                self.output_processor.add_failed_attraction(str(search_item), str(e))
+                # Returned (not raised) so one bad search doesn't cancel
+                # the batch; the zip below routes these to the error log
+                return e
+
+        # tqdm.asyncio ticks as tasks complete, so progress reflects
+        # actual completions; mininterval caps redraw frequency
+        results = await atqdm.gather(
+            *(bounded_search(item) for item in self.search_queue),
+            desc="Searching attractions",
+            mininterval=0.5,
+        )
+
+        for search_item, result in zip(self.search_queue, results):
+            if isinstance(result, BaseException):
+                log.error(f"Search failed for {search_item}: {result}")
+                self.output_processor.add_failed_attraction(str(search_item), str(result))
+                continue
+
+            name = search_item.get('name', '')
+            city = search_item.get('city', '')
+            search_query = f"{name}, {city}" if city else name
+
+            if result:
+                # Take the first result (most relevant)
+                self.urls_queue.append(result[0])
+                log.info(f"Found URL for '{search_query}': {result[0]}")
+            else:
+                log.warning(f"No results found for: {search_query}")
+                self.output_processor.add_failed_attraction(search_query, "Not found in search")
 
     async def _process_url_queue(self):
-        """Process URL queue to scrape attraction data."""
+        """Process URL queue with a pool of concurrent workers."""
         log.info(f"Processing {len(self.urls_queue)} URLs...")
 
-        # Get already processed URLs from checkpoint
+        # Get already processed URLs from checkpoint (a set, so the
+        # filter below is O(N) instead of O(N*M))
         processed_urls = self.output_processor.get_processed_urls()
 
         # Filter out already processed URLs
@@ -133,61 +164,111 @@ class AttractionsScraper:
 
         log.info(f"Skipping {len(self.urls_queue) - len(urls_to_process)} already processed URLs")
 
-        detail_scraper = DetailScraper(self.browser_manager.page)
+        if not urls_to_process:
+            return
+
+        # Feed URLs through a queue to K workers, each borrowing a pooled
+        # context per URL, so page-load I/O overlaps across workers
+        queue = asyncio.Queue()
+        for url in urls_to_process:
+            queue.put_nowait(url)
+
+        progress = tqdm(total=len(urls_to_process), desc="Scraping attractions",
+                        mininterval=0.5)
+
+        async def worker():
+            while True:
+                url = await queue.get()
+                try:
+                    await self._scrape_url(url)
+                finally:
+                    progress.update(1)
+                    queue.task_done()
+
+        num_workers = min(SCRAPE_CONCURRENCY, len(urls_to_process))
+        workers = [asyncio.create_task(worker()) for _ in range(num_workers)]
+
+        try:
+            await queue.join()
+        finally:
+            for w in workers:
+                w.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            progress.close()
+
+    async def _scrape_url(self, url: str):
+        """Scrape a single URL using a pooled browser context."""
+        try:
+            # Recently scraped URLs skip the browser entirely
+            cached = scrape_cache.get(url)
+            if cached is not None:
+                log.info(f"Cache hit for: {url}")
+                self.output_processor.add_attraction(cached)
+                return
+
+            # Throttle before navigating so the shared token bucket caps
+            # the aggregate request rate across all workers
+            await self.rate_limiter.wait()
+
+            async with self.browser_pool.acquire_entry() as entry:
+                page = entry.page
 
-        for url in tqdm(urls_to_process, desc="Scraping attractions"):
-            try:
                 # Navigate to attraction page
-                success = await self.browser_manager.navigate(url)
+                success = await navigate(page, url)
 
                 if not success:
                     self.output_processor.add_failed_attraction(url, "Navigation failed")
                     self.rate_limiter.on_error()
-                    continue
+                    return
 
-                # Extract all data
-                data = await detail_scraper.extract_all(url)
-
-                # Clean data
-                data = self.data_processor.clean_data(data)
-
-                # Infer attraction type if not provided
-                if 'type' not in data:
-                    inferred_type = self.data_processor.infer_attraction_type(
-                        data.get('category'),
-                        url
-                    )
-                    if inferred_type:
-                        data['type'] = inferred_type.value
-
-                # Add data quality info
-                if 'type' in data:
-                    attraction_type = AttractionType(data['type'])
-                    data = self.data_processor.add_data_quality_info(data, attraction_type)
-
-                # Add to output
-                self.output_processor.add_attraction(data)
-
-                # Rate limiting
-                await self.rate_limiter.wait()
-                self.rate_limiter.on_success()
-
-                # Restart browser context periodically (every 20 requests)
-                if self.rate_limiter.request_count % 20 == 0:
-                    log.info("Restarting browser context...")
-                    await self.browser_manager.restart_context()
-                    detail_scraper = DetailScraper(self.browser_manager.page)
+                # Reuse the scraper pinned to this pooled page; it is
+                # recreated only when the slot itself is recycled
+                if entry.scraper is None:
+                    entry.scraper = DetailScraper(page)
 
-            except Exception as e:
-                log.error(f"Failed to scrape {url}: {e}")
-
-                # Take screenshot on error
-                if SCREENSHOT_ON_ERROR:
-                    screenshot_path = OUTPUT_DIR / f"error_{self.rate_limiter.request_count}.png"
-                    await self.browser_manager.screenshot(str(screenshot_path))
-
-                self.output_processor.add_failed_attraction(url, str(e))
-                self.rate_limiter.on_error()
+                # Extract all data
+                try:
+                    data = await entry.scraper.extract_all(url)
+                except Exception:
+                    # Take screenshot on error while we still hold the page
+                    if SCREENSHOT_ON_ERROR:
+                        screenshot_path = OUTPUT_DIR / f"error_{self.rate_limiter.request_count}.png"
+                        try:
+                            await page.screenshot(path=str(screenshot_path), full_page=True)
+                            log.info(f"Screenshot saved to: {screenshot_path}")
+                        except Exception as screenshot_error:
+                            log.error(f"Failed to take screenshot: {screenshot_error}")
+                    raise
+
+            # Clean data
+            data = self.data_processor.clean_data(data)
+
+            # Infer attraction type if not provided, keeping the enum
+            # instance around instead of re-constructing it from the value
+            if 'type' in data:
+                attraction_type = coerce_attraction_type(data['type'])
+            else:
+                attraction_type = self.data_processor.infer_attraction_type(
+                    data.get('category'),
+                    url
+                )
+                if attraction_type:
+                    data['type'] = attraction_type.value
+
+            # Add data quality info
+            if attraction_type:
+                data = self.data_processor.add_data_quality_info(data, attraction_type)
+
+            # Add to output
+            scrape_cache.put(url, data)
+            self.output_processor.add_attraction(data)
+
+            self.rate_limiter.on_success()
+
+        except Exception as e:
+            log.error(f"Failed to scrape {url}: {e}")
+            self.output_processor.add_failed_attraction(url, str(e))
+            self.rate_limiter.on_error()
 
     def _print_summary(self):
         """Print scraping summary statistics."""
@@ -1,7 +1,7 @@
 """
 Pydantic models for attraction data with type-specific field requirements.
 """
-from typing import Optional, List, Dict, Union
+from typing import ClassVar, Optional, List, Dict, Union
 from pydantic import BaseModel, Field, field_validator, model_validator
 from datetime import datetime
 from .enums import AttractionType, PriceRange
@@ -31,6 +31,10 @@ class BaseAttraction(BaseModel):
     website: Optional[str] = Field(None, description="Official website URL")
     tickets_link: Optional[str] = Field(None, description="URL to purchase tickets or make reservations")
 
+    # Key of the AttractionData.attractions bucket this model belongs
+    # to; lets add_attraction dispatch in O(1) instead of isinstance chains
+    _BUCKET: ClassVar[str] = "activities"
+
     class Config:
         use_enum_values = True
 
@@ -38,6 +42,7 @@ class BaseAttraction(BaseModel):
 class ActivityAttraction(BaseAttraction):
     """Model for activity-type attractions."""
     type: AttractionType = Field(default=AttractionType.ACTIVITY, frozen=True)
+    _BUCKET: ClassVar[str] = "activities"
     category: Optional[str] = Field(None, description="Category of the activity")
     price_range: Optional[PriceRange] = Field(None, description="Price range for the activity")
     duration: Optional[int] = Field(None, description="Duration in minutes")
@@ -49,6 +54,7 @@ class ActivityAttraction(BaseAttraction):
 class RestaurantAttraction(BaseAttraction):
     """Model for restaurant-type attractions."""
     type: AttractionType = Field(default=AttractionType.RESTAURANT, frozen=True)
+    _BUCKET: ClassVar[str] = "restaurants"
     category: Optional[str] = Field(None, description="Type of food/cuisine")
     price_range: Optional[PriceRange] = Field(None, description="Price range for the restaurant")
     dietary_options: List[str] = Field(default_factory=list, description="Dietary options (e.g., vegan, vegetarian, kosher)")
@@ -60,6 +66,7 @@ class RestaurantAttraction(BaseAttraction):
 class MallAttraction(BaseAttraction):
     """Model for mall-type attractions."""
     type: AttractionType = Field(default=AttractionType.MALL, frozen=True)
+    _BUCKET: ClassVar[str] = "malls"
     category: Optional[str] = Field(None, description="Category of the mall")
 
     # These fields should NOT be present for malls
@@ -71,6 +78,7 @@ class MallAttraction(BaseAttraction):
 class StoreChainAttraction(BaseAttraction):
     """Model for store chain-type attractions."""
     type: AttractionType = Field(default=AttractionType.STORE_CHAIN, frozen=True)
+    _BUCKET: ClassVar[str] = "store_chains"
     category: Optional[str] = Field(None, description="Category of the store")
     price_range: Optional[PriceRange] = Field(None, description="Price range for the store")
 
@@ -87,6 +95,31 @@ ATTRACTION_MODELS = {
     AttractionType.STORE_CHAIN: StoreChainAttraction,
 }
 
+# Direct value -> enum lookup; avoids the Enum metaclass __call__ overhead
+# on every factory call in batch loops
+_TYPE_BY_VALUE = {t.value: t for t in AttractionType}
+
+
+def coerce_attraction_type(value) -> AttractionType:
+    """
+    Coerce a string value (or enum) to AttractionType via a dict lookup.
+
+    Args:
+        value: Attraction type value string or AttractionType member
+
+    Returns:
+        The matching AttractionType member
+
+    Raises:
+        ValueError: If the value is not a valid attraction type
+    """
+    if isinstance(value, AttractionType):
+        return value
+    try:
+        return _TYPE_BY_VALUE[value]
+    except KeyError:
+        raise ValueError(f"Invalid attraction type: {value}")
+
 
 def create_attraction(data: dict) -> BaseAttraction:
     """
@@ -105,11 +138,7 @@ def create_attraction(data: dict) -> BaseAttraction:
     if not attraction_type:
         raise ValueError("Attraction type is required")
 
-    if isinstance(attraction_type, str):
-        try:
-            attraction_type = AttractionType(attraction_type)
-        except ValueError:
-            raise ValueError(f"Invalid attraction type: {attraction_type}")
+    attraction_type = coerce_attraction_type(attraction_type)
 
     model_class = ATTRACTION_MODELS.get(attraction_type)
     if not model_class:
@@ -118,6 +147,38 @@ def create_attraction(data: dict) -> BaseAttraction:
     return model_class(**data)
 
 
+def create_attraction_trusted(data: dict) -> BaseAttraction:
+    """
+    Build an attraction model without running Pydantic validation.
+
+    Uses model_construct, which skips validators and coercions, so it is
+    only safe for data that has already been cleaned by our own pipeline
+    (e.g. DataProcessor.clean_data). Use create_attraction for untrusted
+    input.
+
+    Args:
+        data: Dictionary containing cleaned attraction data with a 'type' field
+
+    Returns:
+        An instance of the appropriate attraction model
+
+    Raises:
+        ValueError: If attraction type is invalid or missing
+    """
+    attraction_type = data.get('type')
+    if not attraction_type:
+        raise ValueError("Attraction type is required")
+
+    attraction_type = coerce_attraction_type(attraction_type)
+
+    model_class = ATTRACTION_MODELS.get(attraction_type)
+    if not model_class:
+        raise ValueError(f"No model found for attraction type: {attraction_type}")
+
+    known_fields = {k: v for k, v in data.items() if k in model_class.model_fields}
+    return model_class.model_construct(**known_fields)
+
+
 class AttractionData(BaseModel):
     """Container for scraped attractions data with metadata."""
     metadata: Dict = Field(default_factory=dict, description="Metadata about the scraping session")
@@ -134,14 +195,7 @@ class AttractionData(BaseModel):
 
     def add_attraction(self, attraction: BaseAttraction):
         """Add an attraction to the appropriate category."""
-        if isinstance(attraction, RestaurantAttraction):
-            self.attractions["restaurants"].append(attraction)
-        elif isinstance(attraction, ActivityAttraction):
-            self.attractions["activities"].append(attraction)
-        elif isinstance(attraction, MallAttraction):
-            self.attractions["malls"].append(attraction)
-        elif isinstance(attraction, StoreChainAttraction):
-            self.attractions["store_chains"].append(attraction)
+        self.attractions[attraction._BUCKET].append(attraction)
 
     def add_failed(self, input_data: str, error: str):
         """Add a failed attraction attempt."""
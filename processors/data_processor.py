@@ -1,12 +1,81 @@
 """
 Data processing and validation utilities.
 """
+import re
 from typing import Dict, Optional
 from models.enums import AttractionType, PriceRange
 from utils.logger import log
 from utils.hebrew_handler import clean_hebrew_text, normalize_hebrew
 
 
+# Category keywords by attraction type, folded into one compiled
+# alternation with a named group per type so classification is a single
+# C-level scan instead of ~30 Python substring checks per attraction
+_TYPE_KEYWORDS = {
+    AttractionType.RESTAURANT: [
+        'restaurant', 'cafe', 'bar', 'bistro', 'diner', 'eatery',
+        'מסעדה', 'בית קפה', 'בר', 'מזנון',
+    ],
+    AttractionType.MALL: [
+        'mall', 'shopping center', 'shopping centre',
+        'קניון', 'מרכז קניות',
+    ],
+    AttractionType.STORE_CHAIN: [
+        'store', 'shop', 'supermarket', 'retail',
+        'חנות', 'סופרמרקט', 'רשת',
+    ],
+    AttractionType.ACTIVITY: [
+        'park', 'museum', 'attraction', 'zoo', 'aquarium', 'theater',
+        'פארק', 'מוזיאון', 'אטרקציה', 'גן חיות', 'תיאטרון',
+    ],
+}
+
+_TYPE_KEYWORD_RE = re.compile(
+    "|".join(
+        f"(?P<{attraction_type.value}>{'|'.join(map(re.escape, keywords))})"
+        for attraction_type, keywords in _TYPE_KEYWORDS.items()
+    ),
+    re.IGNORECASE,
+)
+
+_GROUP_TO_TYPE = {t.value: t for t in AttractionType}
+
+# Completeness-scoring field tables, precomputed per attraction type so
+# scoring doesn't rebuild and concatenate lists for every record
+_COMMON_FIELDS = ('name', 'description', 'city', 'google_maps_url', 'lat', 'lng')
+_OPTIONAL_COMMON_FIELDS = ('tags', 'hours', 'images', 'busy_days', 'closed_days', 'recommended_time')
+_TYPE_SPECIFIC_FIELDS = {
+    AttractionType.RESTAURANT: ('category', 'price_range', 'dietary_options', 'tickets_link'),
+    AttractionType.ACTIVITY: ('category', 'duration', 'price_range', 'tickets_link'),
+    AttractionType.MALL: ('category',),
+    AttractionType.STORE_CHAIN: ('category', 'price_range'),
+}
+_FIELDS_BY_TYPE = {
+    t: _COMMON_FIELDS + _OPTIONAL_COMMON_FIELDS + _TYPE_SPECIFIC_FIELDS.get(t, ())
+    for t in AttractionType
+}
+
+# Fields whose absence gets reported in data-quality info
+_IMPORTANT_FIELDS = ('name', 'description', 'city', 'lat', 'lng', 'hours')
+
+
+def _clean_str(value: str):
+    """Clean a string value; None means drop the field."""
+    return clean_hebrew_text(value) or None
+
+
+def _clean_list(value: list):
+    """Clean a list of strings; non-string lists pass through untouched."""
+    if value and isinstance(value[0], str):
+        return [v for v in map(clean_hebrew_text, value) if v] or None
+    return value
+
+
+# Cleaner dispatch by exact value type; anything unlisted is kept as-is,
+# and a cleaner returning None drops the field
+_CLEANERS = {str: _clean_str, list: _clean_list}
+
+
 class DataProcessor:
     """Processes and validates scraped data."""
 
@@ -27,22 +96,16 @@ class DataProcessor:
             if value is None:
                 continue
 
-            # Clean string values
-            if isinstance(value, str):
-                cleaned_value = clean_hebrew_text(value)
-                if cleaned_value:
-                    cleaned[key] = cleaned_value
-
-            # Clean lists of strings
-            elif isinstance(value, list) and value and isinstance(value[0], str):
-                cleaned_list = [clean_hebrew_text(v) for v in value]
-                cleaned_list = [v for v in cleaned_list if v]
-                if cleaned_list:
-                    cleaned[key] = cleaned_list
-
-            # Keep other types as-is
-            else:
+            # One dict lookup picks the cleaner instead of a chain of
+            # isinstance checks per field
+            cleaner = _CLEANERS.get(type(value))
+            if cleaner is None:
+                # Keep other types as-is
                 cleaned[key] = value
+            else:
+                value = cleaner(value)
+                if value is not None:
+                    cleaned[key] = value
 
         return cleaned
 
@@ -61,39 +124,9 @@ class DataProcessor:
         if not category:
             return None
 
-        category_lower = category.lower()
-
-        # Restaurant keywords
-        restaurant_keywords = [
-            'restaurant', 'cafe', 'bar', 'bistro', 'diner', 'eatery',
-            'מסעדה', 'בית קפה', 'בר', 'מזנון'
-        ]
-        if any(keyword in category_lower for keyword in restaurant_keywords):
-            return AttractionType.RESTAURANT
-
-        # Mall keywords
-        mall_keywords = [
-            'mall', 'shopping center', 'shopping centre',
-            'קניון', 'מרכז קניות'
-        ]
-        if any(keyword in category_lower for keyword in mall_keywords):
-            return AttractionType.MALL
-
-        # Store chain keywords
-        store_keywords = [
-            'store', 'shop', 'supermarket', 'retail',
-            'חנות', 'סופרמרקט', 'רשת'
-        ]
-        if any(keyword in category_lower for keyword in store_keywords):
-            return AttractionType.STORE_CHAIN
-
-        # Activity keywords (default)
-        activity_keywords = [
-            'park', 'museum', 'attraction', 'zoo', 'aquarium', 'theater',
-            'פארק', 'מוזיאון', 'אטרקציה', 'גן חיות', 'תיאטרון'
-        ]
-        if any(keyword in category_lower for keyword in activity_keywords):
-            return AttractionType.ACTIVITY
+        match = _TYPE_KEYWORD_RE.search(category)
+        if match:
+            return _GROUP_TO_TYPE[match.lastgroup]
 
         # Default to activity
         return AttractionType.ACTIVITY
@@ -110,26 +143,10 @@ class DataProcessor:
         Returns:
             Completeness score between 0 and 1
         """
-        # Define required and optional fields by type
-        common_fields = ['name', 'description', 'city', 'google_maps_url', 'lat', 'lng']
-        optional_common = ['tags', 'hours', 'images', 'busy_days', 'closed_days', 'recommended_time']
-
-        type_specific = {
-            AttractionType.RESTAURANT: ['category', 'price_range', 'dietary_options', 'tickets_link'],
-            AttractionType.ACTIVITY: ['category', 'duration', 'price_range', 'tickets_link'],
-            AttractionType.MALL: ['category'],
-            AttractionType.STORE_CHAIN: ['category', 'price_range'],
-        }
-
-        # Count present fields
-        total_fields = len(common_fields) + len(optional_common) + len(type_specific.get(attraction_type, []))
-        present_fields = 0
-
-        for field in common_fields + optional_common + type_specific.get(attraction_type, []):
-            if field in data and data[field]:
-                present_fields += 1
+        fields = _FIELDS_BY_TYPE[attraction_type]
 
-        completeness = present_fields / total_fields if total_fields > 0 else 0
+        present_fields = sum(1 for field in fields if data.get(field))
+        completeness = present_fields / len(fields) if fields else 0
 
         return round(completeness, 2)
 
@@ -171,8 +188,7 @@ class DataProcessor:
         """
         completeness = DataProcessor.calculate_completeness(data, attraction_type)
 
-        important_fields = ['name', 'description', 'city', 'lat', 'lng', 'hours']
-        missing_fields = [field for field in important_fields if field not in data or not data[field]]
+        missing_fields = [field for field in _IMPORTANT_FIELDS if not data.get(field)]
 
         return {
             'completeness': completeness,
@@ -2,83 +2,154 @@
 Process input files to generate attraction processing queue.
 """
 import csv
-import json
+import re
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import Dict, Iterator, List, Tuple, Union
+
+import orjson
+
 from utils.logger import log
+from utils.url_cache import normalize_url
 from models.enums import AttractionType
 
 
+# Compiled once: one C-level scan per line instead of two Python-level
+# substring checks on the TXT loader hot path
+_GMAPS_URL_RE = re.compile(r"(?:google\.com/maps|maps\.app\.goo\.gl)")
+
+# Stricter form for validate_url: full Maps URLs must point at a place
+# or search page
+_PLACE_OR_SEARCH_RE = re.compile(r"google\.com/maps/(?:place|search)/")
+
+
 class InputProcessor:
     """Processes input files and generates attraction queue."""
 
-    def process_file(self, filepath: str) -> Tuple[List[str], List[Dict]]:
+    def iter_items(self, filepath: str) -> Iterator[Tuple[str, Union[str, Dict]]]:
         """
-        Process input file and return URLs and search configs.
+        Stream input items without materializing full lists.
+
+        Yields ("url", str) or ("search", dict) tuples as they are
+        parsed, so large files never hold more than one row in memory
+        and callers can overlap parsing with downstream work.
 
         Args:
             filepath: Path to input file
 
-        Returns:
-            Tuple of (urls_list, search_configs_list)
+        Yields:
+            ("url", url_string) or ("search", search_config_dict)
         """
         filepath = Path(filepath)
 
         if not filepath.exists():
             log.error(f"Input file not found: {filepath}")
-            return [], []
+            return
 
         log.info(f"Processing input file: {filepath}")
 
         # Determine file type and process accordingly
         if filepath.suffix.lower() == '.csv':
-            return self._process_csv(filepath)
+            yield from self._iter_csv(filepath)
         elif filepath.suffix.lower() == '.txt':
-            return self._process_txt(filepath)
+            yield from self._iter_txt(filepath)
         elif filepath.suffix.lower() == '.json':
-            return self._process_json(filepath)
+            yield from self._iter_json(filepath)
         else:
             log.error(f"Unsupported file type: {filepath.suffix}")
-            return [], []
 
-    def _process_csv(self, filepath: Path) -> Tuple[List[str], List[Dict]]:
-        """Process CSV file with attraction names and types."""
+    def process_file(self, filepath: str) -> Tuple[List[str], List[Dict]]:
+        """
+        Process input file and return URLs and search configs.
+
+        Compatibility wrapper around iter_items for callers that want
+        fully materialized lists.
+
+        Args:
+            filepath: Path to input file
+
+        Returns:
+            Tuple of (urls_list, search_configs_list)
+        """
         urls = []
         search_items = []
 
+        for kind, item in self.iter_items(filepath):
+            if kind == 'url':
+                urls.append(item)
+            else:
+                search_items.append(item)
+
+        return urls, search_items
+
+    def _iter_csv(self, filepath: Path) -> Iterator[Tuple[str, Union[str, Dict]]]:
+        """Stream items from a CSV file with attraction names and types."""
+        url_count = 0
+        search_count = 0
+        seen_urls = set()
+        seen_items = set()
+
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
+            # csv.reader + cached column indices avoids building a dict
+            # per row; the 1 MiB buffer keeps read syscalls infrequent
+            with open(filepath, 'r', encoding='utf-8', newline='',
+                      buffering=1 << 20) as f:
+                reader = csv.reader(f)
+
+                try:
+                    header = next(reader)
+                except StopIteration:
+                    return
+
+                idx = {h.strip(): i for i, h in enumerate(header)}
+                name_idx = idx.get('name')
+                city_idx = idx.get('city')
+                type_idx = idx.get('type')
 
                 for row in reader:
-                    name = row.get('name', '').strip()
-                    city = row.get('city', '').strip()
-                    attr_type = row.get('type', '').strip()
+                    if not row:
+                        continue
 
+                    name = row[name_idx].strip() \
+                        if name_idx is not None and name_idx < len(row) else ''
                     if not name:
                         continue
 
+                    city = row[city_idx].strip() \
+                        if city_idx is not None and city_idx < len(row) else ''
+                    attr_type = row[type_idx].strip() \
+                        if type_idx is not None and type_idx < len(row) else ''
+
                     # Check if it's a URL
                     if name.startswith('http'):
-                        urls.append(name)
+                        # Skip duplicates (each one costs a full navigation)
+                        key = normalize_url(name)
+                        if key in seen_urls:
+                            continue
+                        seen_urls.add(key)
+                        url_count += 1
+                        yield 'url', name
                     else:
                         # It's a name, we'll need to search for it
-                        search_items.append({
+                        item_key = (name, city)
+                        if item_key in seen_items:
+                            continue
+                        seen_items.add(item_key)
+                        search_count += 1
+                        yield 'search', {
                             'name': name,
                             'city': city,
                             'type': attr_type
-                        })
+                        }
 
-            log.info(f"Loaded {len(urls)} URLs and {len(search_items)} search items from CSV")
+            log.info(f"Loaded {url_count} URLs and {search_count} search items from CSV")
 
         except Exception as e:
             log.error(f"Failed to process CSV file: {e}")
 
-        return urls, search_items
-
-    def _process_txt(self, filepath: Path) -> Tuple[List[str], List[Dict]]:
-        """Process text file with URLs (one per line)."""
-        urls = []
+    def _iter_txt(self, filepath: Path) -> Iterator[Tuple[str, str]]:
+        """Stream URLs from a text file (one per line)."""
+        url_count = 0
+        seen_urls = set()
 
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
@@ -90,59 +161,71 @@ class InputProcessor:
                         continue
 
                     # Validate URL (accept both full and shortened Google Maps URLs)
-                    if 'google.com/maps' in line or 'maps.app.goo.gl' in line:
-                        urls.append(line)
+                    if _GMAPS_URL_RE.search(line):
+                        # Skip duplicates (each one costs a full navigation)
+                        key = normalize_url(line)
+                        if key in seen_urls:
+                            continue
+                        seen_urls.add(key)
+                        url_count += 1
+                        yield 'url', line
                     else:
                         log.warning(f"Invalid URL in text file: {line}")
 
-            log.info(f"Loaded {len(urls)} URLs from text file")
+            log.info(f"Loaded {url_count} URLs from text file")
 
         except Exception as e:
             log.error(f"Failed to process text file: {e}")
 
-        return urls, []
-
-    def _process_json(self, filepath: Path) -> Tuple[List[str], List[Dict]]:
-        """Process JSON file with search configuration."""
-        urls = []
-        search_configs = []
+    def _iter_json(self, filepath: Path) -> Iterator[Tuple[str, Union[str, Dict]]]:
+        """Stream items from a JSON file with search configuration."""
+        url_count = 0
+        search_count = 0
 
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = orjson.loads(filepath.read_bytes())
 
-            # Check for URLs list
+            # Check for URLs list (de-duplicated, order preserved)
             if 'urls' in data:
-                urls = data['urls']
+                seen_urls = set()
+                for url in data['urls']:
+                    key = normalize_url(url)
+                    if key in seen_urls:
+                        continue
+                    seen_urls.add(key)
+                    url_count += 1
+                    yield 'url', url
 
             # Check for search configuration
             if 'search_config' in data:
-                search_configs.append(data['search_config'])
+                search_count += 1
+                yield 'search', data['search_config']
 
             # Check for manual attractions list
             if 'attractions' in data:
+                seen_items = set()
                 for attr in data['attractions']:
                     name = attr.get('name')
                     city = attr.get('city')
                     attr_type = attr.get('type')
 
-                    if name:
-                        search_configs.append({
+                    if name and (name, city) not in seen_items:
+                        seen_items.add((name, city))
+                        search_count += 1
+                        yield 'search', {
                             'name': name,
                             'city': city,
                             'type': attr_type
-                        })
+                        }
 
-            log.info(f"Loaded {len(urls)} URLs and {len(search_configs)} search configs from JSON")
+            log.info(f"Loaded {url_count} URLs and {search_count} search configs from JSON")
 
         except Exception as e:
             log.error(f"Failed to process JSON file: {e}")
 
-        return urls, search_configs
-
     def validate_url(self, url: str) -> bool:
         """Validate if URL is a valid Google Maps URL."""
-        return 'google.com/maps' in url and ('/place/' in url or '/search/' in url)
+        return _PLACE_OR_SEARCH_RE.search(url) is not None
 
     def build_search_url(self, name: str, city: str = "") -> str:
         """Build a Google Maps search URL from attraction name and city."""
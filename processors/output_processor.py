@@ -1,14 +1,37 @@
 """
 Process and write output data to JSON files.
 """
-import json
+import os
+import queue
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List
-from models.attraction import AttractionData, BaseAttraction, create_attraction
+from typing import Dict, List, Set
+
+import orjson
+
+from models.attraction import AttractionData, BaseAttraction, create_attraction_trusted
 from utils.logger import log
-from config.settings import OUTPUT_DIR, CHECKPOINT_ENABLED
+from config.settings import OUTPUT_DIR, CHECKPOINT_ENABLED, PRETTY_OUTPUT
+
+
+# Checkpoint flush batching: records are pushed to the OS at most every
+# CHECKPOINT_FLUSH_EVERY appends or CHECKPOINT_FLUSH_INTERVAL seconds,
+# whichever comes first, instead of one flush per record
+CHECKPOINT_FLUSH_EVERY = 32
+CHECKPOINT_FLUSH_INTERVAL = 1.0
+
+# Individual attraction files accumulate in memory and get written in
+# batches of this size (and once more at finalize)
+INDIVIDUAL_FLUSH_EVERY = 32
+
+# Filename sanitization patterns, compiled once instead of per call
+_INVALID_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+_SEPARATORS_RE = re.compile(r'[\s\-\/]+')
+_NON_SAFE_RE = re.compile(r'[^\w\-_]')
 
 
 class OutputProcessor:
@@ -18,41 +41,97 @@ class OutputProcessor:
         # Ensure output directory exists
         OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
+        # One timestamp for both the default filename and the directory,
+        # so the two can't disagree across a second boundary
+        self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
         # Generate output filename if not provided
         if not output_filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_filename = f"attractions_{timestamp}.json"
+            output_filename = f"attractions_{self.timestamp}.json"
 
         self.output_filepath = OUTPUT_DIR / output_filename
         self.checkpoint_filepath = OUTPUT_DIR / f"{output_filename}.checkpoint"
 
         # Create subdirectory for individual attraction files
-        self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.individual_dir = OUTPUT_DIR / f"attractions_{self.timestamp}"
         self.individual_dir.mkdir(parents=True, exist_ok=True)
 
+        # OUTPUT_DIR-relative prefix for index entries, computed once
+        # instead of a Path.relative_to per attraction
+        self._individual_relname = self.individual_dir.name
+
         # Initialize data container
         self.data = AttractionData()
 
+        # Running set of scraped URLs, kept in step with add_attraction
+        # so dedup checks don't rescan every stored attraction
+        self._processed_urls = set()
+
         # Track individual file paths
         self.individual_files = []
 
+        # Serialized individual files waiting to be written, plus a
+        # per-base-name counter for O(1) duplicate filename resolution
+        self._pending_writes = []
+        self._name_counts = {}
+
+        # Append-mode handle for the JSONL checkpoint, opened lazily
+        self._checkpoint_fh = None
+        self._unflushed = 0
+        self._last_flush = time.monotonic()
+
         # Load checkpoint if exists
         if CHECKPOINT_ENABLED:
             self._load_checkpoint()
 
+        # Background writer: add_attraction enqueues disk work and
+        # returns immediately; this thread owns the checkpoint handle
+        # and the pending individual-file batch until finalize joins it
+        self._write_queue = queue.Queue()
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop, name="output-writer", daemon=True)
+        self._writer_thread.start()
+
+    def _writer_loop(self):
+        """Drain queued attractions, doing all per-record disk I/O."""
+        while True:
+            attraction = self._write_queue.get()
+            if attraction is None:
+                break
+            try:
+                # Serialize once; the compact bytes feed both the
+                # checkpoint line and (unless PRETTY_OUTPUT) the file
+                entry = attraction.model_dump(mode="json", exclude_none=True)
+                compact = orjson.dumps(entry)
+                if PRETTY_OUTPUT:
+                    payload = orjson.dumps(entry, option=orjson.OPT_INDENT_2)
+                else:
+                    payload = compact
+
+                self._write_individual_file(attraction, payload)
+                if CHECKPOINT_ENABLED:
+                    self._append_checkpoint(compact)
+            except Exception as e:
+                log.error(f"Writer thread failed for "
+                          f"{getattr(attraction, 'name', 'Unknown')}: {e}")
+
     def _load_checkpoint(self):
-        """Load data from checkpoint file if it exists."""
+        """Load attractions from the JSONL checkpoint file if it exists."""
         if self.checkpoint_filepath.exists():
             try:
-                with open(self.checkpoint_filepath, 'r', encoding='utf-8') as f:
-                    checkpoint_data = json.load(f)
-
-                log.info(f"Loaded checkpoint from: {self.checkpoint_filepath}")
-
-                # Reconstruct AttractionData from checkpoint
-                # (simplified - in production you'd fully deserialize)
-                self.data = AttractionData(**checkpoint_data)
+                count = 0
+                with open(self.checkpoint_filepath, 'rb') as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        attraction = create_attraction_trusted(orjson.loads(line))
+                        self.data.add_attraction(attraction)
+                        if getattr(attraction, 'google_maps_url', None):
+                            self._processed_urls.add(attraction.google_maps_url)
+                        count += 1
+
+                log.info(f"Loaded {count} attractions from checkpoint: {self.checkpoint_filepath}")
 
             except Exception as e:
                 log.error(f"Failed to load checkpoint: {e}")
@@ -60,11 +139,11 @@ class OutputProcessor:
     def _sanitize_filename(self, name: str) -> str:
         """Sanitize attraction name for use as filename."""
         # Remove or replace invalid filename characters
-        sanitized = re.sub(r'[<>:"/\\|?*]', '', name)
+        sanitized = _INVALID_CHARS_RE.sub('', name)
         # Replace spaces and special chars with underscores
-        sanitized = re.sub(r'[\s\-\/]+', '_', sanitized)
+        sanitized = _SEPARATORS_RE.sub('_', sanitized)
         # Remove non-ASCII characters or keep only safe ones
-        sanitized = re.sub(r'[^\w\-_]', '', sanitized)
+        sanitized = _NON_SAFE_RE.sub('', sanitized)
         # Limit length
         if len(sanitized) > 100:
             sanitized = sanitized[:100]
@@ -86,21 +165,22 @@ class OutputProcessor:
             if attraction_type and 'type' not in attraction_data:
                 attraction_data['type'] = attraction_type
 
-            # Create and validate attraction using Pydantic
-            attraction = create_attraction(attraction_data)
+            # Build the attraction model; data reaching this point has
+            # already been cleaned by DataProcessor, so the trusted
+            # model_construct path skips validator dispatch per record
+            attraction = create_attraction_trusted(attraction_data)
 
             # Add to container
             self.data.add_attraction(attraction)
+            if getattr(attraction, 'google_maps_url', None):
+                self._processed_urls.add(attraction.google_maps_url)
 
-            # Write individual JSON file
-            self._write_individual_file(attraction)
+            # Hand serialization and disk writes (individual file +
+            # checkpoint line) to the background writer thread
+            self._write_queue.put(attraction)
 
             log.info(f"Added attraction: {attraction.name}")
 
-            # Save checkpoint after each addition
-            if CHECKPOINT_ENABLED:
-                self._save_checkpoint()
-
         except Exception as e:
             log.error(f"Failed to add attraction: {e}")
             # Add to failed list
@@ -109,89 +189,182 @@ class OutputProcessor:
                 str(e)
             )
 
-    def _write_individual_file(self, attraction: BaseAttraction):
-        """Write individual JSON file for an attraction."""
+    def _write_individual_file(self, attraction: BaseAttraction, payload: bytes):
+        """Queue an individual JSON file for an attraction."""
         try:
             # Generate filename from attraction name
             filename = self._sanitize_filename(attraction.name)
             filepath = self.individual_dir / f"{filename}.json"
 
-            # Handle duplicate filenames
-            counter = 1
-            while filepath.exists():
-                filepath = self.individual_dir / f"{filename}_{counter}.json"
-                counter += 1
-
-            # Write attraction data to individual file (exclude null values)
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(
-                    json.loads(attraction.model_dump_json(exclude_none=True)),
-                    f,
-                    ensure_ascii=False,
-                    indent=2
-                )
+            # Handle duplicate filenames with a counter per base name;
+            # the per-run output directory is fresh, so no stat() needed
+            n = self._name_counts.get(filename, 0)
+            self._name_counts[filename] = n + 1
+            if n:
+                filepath = self.individual_dir / f"{filename}_{n}.json"
+
+            # Queue the serialized bytes; actual disk writes happen in
+            # batches so the add path isn't one open/write/close per record
+            self._pending_writes.append((filepath, payload))
 
             # Track the file
             self.individual_files.append({
                 "name": attraction.name,
                 "type": attraction.type,
                 "file": filepath.name,
-                "filepath": str(filepath.relative_to(OUTPUT_DIR))
+                "filepath": f"{self._individual_relname}/{filepath.name}"
             })
 
-            log.debug(f"Wrote individual file: {filepath}")
+            if len(self._pending_writes) >= INDIVIDUAL_FLUSH_EVERY:
+                self._flush_pending()
 
         except Exception as e:
             log.error(f"Failed to write individual file for {attraction.name}: {e}")
 
+    @staticmethod
+    def _write_one(item):
+        """Write and sync a single queued individual file."""
+        filepath, payload = item
+        try:
+            fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, payload)
+                try:
+                    os.fsync(fd)
+                    # These files are never read back by the run; tell
+                    # the kernel to drop their pages after the sync
+                    if hasattr(os, 'posix_fadvise'):
+                        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                except OSError:
+                    pass
+            finally:
+                os.close(fd)
+            log.debug(f"Wrote individual file: {filepath}")
+        except Exception as e:
+            log.error(f"Failed to write individual file {filepath}: {e}")
+
+    def _flush_pending(self):
+        """Write all queued individual files to disk in one pass.
+
+        Writes fan out over a thread pool: file I/O releases the GIL and
+        fsync latency overlaps across files instead of serializing.
+        """
+        if not self._pending_writes:
+            return
+
+        if len(self._pending_writes) == 1:
+            self._write_one(self._pending_writes[0])
+        else:
+            workers = min(len(self._pending_writes), 8)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(self._write_one, self._pending_writes))
+
+        self._pending_writes.clear()
+
     def add_failed_attraction(self, input_data: str, error: str):
         """Add a failed attraction attempt."""
         self.data.add_failed(input_data, error)
         log.warning(f"Added failed attraction: {input_data} - {error}")
 
-    def _save_checkpoint(self):
-        """Save current data to checkpoint file."""
+    def _append_checkpoint(self, line: bytes):
+        """Append one pre-serialized attraction line to the JSONL checkpoint.
+
+        One orjson line per record keeps checkpoint cost proportional to
+        new data instead of re-serializing everything scraped so far.
+        """
         try:
-            with open(self.checkpoint_filepath, 'w', encoding='utf-8') as f:
-                json.dump(
-                    json.loads(self.data.model_dump_json(exclude_none=True)),
-                    f,
-                    ensure_ascii=False,
-                    indent=2
-                )
+            if self._checkpoint_fh is None:
+                self._checkpoint_fh = open(self.checkpoint_filepath, 'ab',
+                                           buffering=1 << 16)
+
+            self._checkpoint_fh.write(line + b"\n")
 
-            log.debug(f"Checkpoint saved to: {self.checkpoint_filepath}")
+            # Flush in batches; at most CHECKPOINT_FLUSH_EVERY records
+            # (or one flush interval) can be lost on a hard crash
+            self._unflushed += 1
+            now = time.monotonic()
+            if (self._unflushed >= CHECKPOINT_FLUSH_EVERY
+                    or now - self._last_flush >= CHECKPOINT_FLUSH_INTERVAL):
+                self._checkpoint_fh.flush()
+                self._unflushed = 0
+                self._last_flush = now
+
+            log.debug(f"Checkpoint appended to: {self.checkpoint_filepath}")
 
         except Exception as e:
             log.error(f"Failed to save checkpoint: {e}")
 
+    def close(self):
+        """Stop the writer thread and flush buffered output.
+
+        Idempotent, and the only way the writer thread ever exits: the
+        thread target is a bound method, so a processor whose job failed
+        or was cancelled would otherwise leak the thread and pin itself
+        (data container included) in memory for the life of the server.
+        The checkpoint file is kept so an interrupted run can resume;
+        finalize() removes it once the index is safely written.
+        """
+        if self._writer_thread.is_alive():
+            self._write_queue.put(None)
+            self._writer_thread.join()
+
+        # Write any individual files still queued in memory
+        self._flush_pending()
+
+        if self._checkpoint_fh is not None:
+            try:
+                self._checkpoint_fh.flush()
+                self._checkpoint_fh.close()
+            except Exception as e:
+                log.error(f"Failed to close checkpoint file: {e}")
+            self._checkpoint_fh = None
+
     def finalize(self):
         """Finalize and write the index file."""
+        # Stop the writer thread; everything enqueued so far lands on
+        # disk before the index is built
+        self.close()
+
+        # One directory fsync settles all the new directory entries
+        try:
+            dir_fd = os.open(self.individual_dir, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        except OSError:
+            pass
+
         # Update metadata
         stats = self.data.get_stats()
 
-        # Create index file with metadata and references
-        index_data = {
-            "metadata": {
-                "scraped_at": datetime.now().isoformat(),
-                "version": "1.0.0",
-                **stats
-            },
-            "output_directory": str(self.individual_dir.relative_to(OUTPUT_DIR)),
-            "attractions": self.individual_files,
-            "failed_attractions": self.data.failed_attractions
+        metadata = {
+            "scraped_at": datetime.now().isoformat(),
+            "version": "1.0.0",
+            **stats
         }
 
-        # Write index file
+        # Write index file, streaming one entry at a time so the full
+        # index never exists as a second in-memory copy
         index_filepath = OUTPUT_DIR / f"index_{self.timestamp}.json"
         try:
-            with open(index_filepath, 'w', encoding='utf-8') as f:
-                json.dump(
-                    index_data,
-                    f,
-                    ensure_ascii=False,
-                    indent=2
-                )
+            with open(index_filepath, 'wb', buffering=1 << 16) as f:
+                f.write(b'{"metadata":' + orjson.dumps(metadata))
+                f.write(b',"output_directory":' + orjson.dumps(
+                    str(self.individual_dir.relative_to(OUTPUT_DIR))))
+
+                f.write(b',"attractions":[')
+                for i, entry in enumerate(self.individual_files):
+                    if i:
+                        f.write(b',')
+                    f.write(orjson.dumps(entry))
+
+                f.write(b'],"failed_attractions":[')
+                for i, entry in enumerate(self.data.failed_attractions):
+                    if i:
+                        f.write(b',')
+                    f.write(orjson.dumps(entry))
+                f.write(b']}')
 
             log.info(f"Index file saved to: {index_filepath}")
             log.info(f"Individual attraction files saved to: {self.individual_dir}")
@@ -199,10 +372,11 @@ class OutputProcessor:
             # Print statistics
             log.info(f"Statistics: {stats}")
 
-            # Remove checkpoint file
-            if CHECKPOINT_ENABLED and self.checkpoint_filepath.exists():
-                self.checkpoint_filepath.unlink()
-                log.debug("Checkpoint file removed")
+            # Remove checkpoint file (the handle was closed by close())
+            if CHECKPOINT_ENABLED:
+                if self.checkpoint_filepath.exists():
+                    self.checkpoint_filepath.unlink()
+                    log.debug("Checkpoint file removed")
 
             return index_filepath
 
@@ -214,16 +388,13 @@ class OutputProcessor:
         """Get current statistics."""
         return self.data.get_stats()
 
-    def get_processed_urls(self) -> List[str]:
-        """Get list of URLs that have been processed."""
-        processed = []
-
-        for attractions_list in self.data.attractions.values():
-            for attraction in attractions_list:
-                if hasattr(attraction, 'google_maps_url') and attraction.google_maps_url:
-                    processed.append(attraction.google_maps_url)
+    def get_processed_urls(self) -> Set[str]:
+        """Get the set of URLs that have been processed (O(1) membership).
 
-        return processed
+        Maintained incrementally by add_attraction, so this is a constant-
+        time accessor rather than a scan over every stored attraction.
+        """
+        return self._processed_urls
 
     def write_error_log(self):
         """Write a separate error log file."""
@@ -233,13 +404,10 @@ class OutputProcessor:
         error_filepath = OUTPUT_DIR / f"{self.output_filepath.stem}_errors.json"
 
         try:
-            with open(error_filepath, 'w', encoding='utf-8') as f:
-                json.dump(
-                    {"failed": self.data.failed_attractions},
-                    f,
-                    ensure_ascii=False,
-                    indent=2
-                )
+            error_filepath.write_bytes(orjson.dumps(
+                {"failed": self.data.failed_attractions},
+                option=orjson.OPT_INDENT_2,
+            ))
 
             log.info(f"Error log saved to: {error_filepath}")
 
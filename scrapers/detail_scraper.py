@@ -1,7 +1,9 @@
 """
 Scraper for extracting detailed attraction information from Google Maps pages.
 """
+import asyncio
 import re
+import unicodedata
 from typing import Optional, List, Dict, Tuple
 from playwright.async_api import Page, TimeoutError as PlaywrightTimeout
 from utils.logger import log
@@ -12,15 +14,105 @@ from utils.hebrew_handler import (
     is_closed_hebrew,
     detect_time_of_day_hebrew,
 )
-from config.selectors import SELECTORS, PATTERNS, HEBREW_DAYS
+from config.selectors import (
+    SELECTORS,
+    SELECTORS_FLAT,
+    SELECTORS_COMBINED,
+    PATTERNS,
+    HEBREW_DAYS,
+    HEBREW_DAYS_RE,
+    ENGLISH_TO_HEBREW_DAYS,
+)
 from config.settings import ELEMENT_WAIT_TIMEOUT, MAX_IMAGES, SCREENSHOT_ON_ERROR
 
 
+# Patterns used on every page, compiled once at import instead of going
+# through the re-module cache lookup per call
+_COORDS_3D4D_RE = re.compile(r'!3d(-?\d+\.\d+)!4d(-?\d+\.\d+)')
+_COORDS_AT_RE = re.compile(r'@(-?\d+\.\d+),(-?\d+\.\d+)')
+_POSTAL_JP_RE = re.compile(r'〒\d{3}-?\d{4}\s*')
+_HHMM_RE = re.compile(r'(\d{1,2}):(\d{2})')
+_TAG_SEP_RE = re.compile(r'[,•·]')
+_IMG_RES_RE = re.compile(r'=w\d+-h\d+')
+
+def _nfc(text: Optional[str]) -> Optional[str]:
+    """
+    Normalize raw page text to NFC so Hebrew keyword matching works.
+
+    Pages can deliver decomposed (NFD) Hebrew, in which case substring
+    and regex matches against our composed constants silently miss.
+    is_normalized short-circuits the common already-NFC case.
+    """
+    if text and not unicodedata.is_normalized('NFC', text):
+        return unicodedata.normalize('NFC', text)
+    return text
+
+
+# City-name variants -> Hebrew city names, scanned as one alternation per
+# address instead of one substring check per variant. 東京 precedes 京都 in
+# the map so a leftmost match on "東京都" resolves to Tokyo, not Kyoto.
+_CITY_MAPPING = {
+    'Tokyo': 'טוקיו',
+    'tokyo': 'טוקיו',
+    '東京': 'טוקיו',
+    'Osaka': 'אוסקה',
+    'osaka': 'אוסקה',
+    '大阪': 'אוסקה',
+    'Kyoto': 'קיוטו',
+    'kyoto': 'קיוטו',
+    '京都': 'קיוטו',
+    'Yokohama': 'יוקוהמה',
+    'yokohama': 'יוקוהמה',
+    '横浜': 'יוקוהמה',
+}
+_CITY_RE = re.compile("|".join(map(re.escape, _CITY_MAPPING)))
+
+# Tokyo neighborhoods that should be normalized to Tokyo
+_TOKYO_AREAS = ['Shibuya', 'Shinjuku', 'Chiyoda', 'Minato', 'Chūō', 'Chuo',
+                'Taitō', 'Taito', 'Sumida', 'Kōtō', 'Koto', 'Shinagawa',
+                'Meguro', 'Ōta', 'Ota', 'Setagaya', 'Nakano', 'Suginami',
+                'Toshima', 'Kita', 'Arakawa', 'Itabashi', 'Nerima', 'Adachi',
+                'Katsushika', 'Edogawa']
+_TOKYO_RE = re.compile("|".join(map(re.escape, _TOKYO_AREAS)))
+
+# Dietary keyword -> canonical label, scanned as one alternation (longest
+# words first so e.g. 'טבעונית' wins over its prefix 'טבעוני')
+_DIETARY_KEYWORDS = {
+    'vegan': 'vegan', 'טבעוני': 'vegan', 'טבעונית': 'vegan',
+    'vegetarian': 'vegetarian', 'צמחוני': 'vegetarian', 'צמחונית': 'vegetarian',
+    'kosher': 'kosher', 'כשר': 'kosher', 'כשרה': 'kosher',
+    'gluten-free': 'gluten-free', 'ללא גלוטן': 'gluten-free',
+    'halal': 'halal', 'חלאל': 'halal',
+}
+_DIETARY_RE = re.compile("|".join(
+    map(re.escape, sorted(_DIETARY_KEYWORDS, key=len, reverse=True))))
+_DIETARY_LABELS = ('vegan', 'vegetarian', 'kosher', 'gluten-free', 'halal')
+
+# Static fields fetched in one evaluate right after navigation: selector
+# key plus the attribute to read (None means innerText)
+_PRIME_FIELDS = (
+    ("name", None),
+    ("description", None),
+    ("category", None),
+    ("address", None),
+    ("price", None),
+    ("review_tags", None),
+    ("website", "href"),
+    ("book_tickets", "href"),
+    ("reserve_table", "href"),
+)
+
+
 class DetailScraper:
     """Extracts detailed information from a Google Maps attraction page."""
 
     def __init__(self, page: Page):
         self.page = page
+        # Per-page memo for selector extractions; several fields reuse
+        # description/category, and each miss is a browser round trip
+        self._cache: Dict = {}
+        # Raw values bulk-fetched by _prime_cache, keyed by selector key
+        self._primed: Dict = {}
 
     async def extract_all(self, url: str) -> Dict:
         """
@@ -34,6 +126,15 @@ class DetailScraper:
         """
         log.info(f"Extracting data from: {url}")
 
+        # The scraper is pinned to a pooled page across URLs, so the
+        # memo from the previous page must not leak into this one
+        self._cache.clear()
+        self._primed.clear()
+
+        # Bulk-fetch every static field in one evaluate; the per-field
+        # extractors below then read from the memo instead of the page
+        await self._prime_cache()
+
         data = {
             "google_maps_url": url,
         }
@@ -51,64 +152,66 @@ class DetailScraper:
         if coords:
             data["lat"], data["lng"] = coords
 
-        # Extract basic information
-        data["name"] = await self._extract_name()
-        data["description"] = await self._extract_description()
-        data["category"] = await self._extract_category()
-
-        # Extract location
-        data["city"] = await self._extract_city()
-
-        # Extract price range
-        price_range = await self._extract_price_range()
-        if price_range:
-            data["price_range"] = price_range
-
-        # Extract hours
-        hours = await self._extract_hours()
-        if hours:
-            data["hours"] = hours
-            data["closed_days"] = self._get_closed_days(hours)
+        # Read-only extractions are independent, so they run under one
+        # gather and Playwright pipelines the round trips on the page's
+        # connection instead of paying them one at a time
+        (data["name"], data["description"], data["category"], data["city"],
+         website, tickets_link, busy_days, dietary) = await asyncio.gather(
+            self._extract_name(),
+            self._extract_description(),
+            self._extract_category(),
+            self._extract_city(),
+            self._extract_website(),
+            self._extract_tickets_or_reservations_link(),
+            self._extract_busy_days(),
+            self._extract_dietary_options(),
+        )
 
-        # Extract popular times / busy days
-        busy_days = await self._extract_busy_days()
         if busy_days:
             data["busy_days"] = busy_days
 
-        # Extract recommended time
-        recommended_time = await self._extract_recommended_time()
-        if recommended_time:
-            data["recommended_time"] = recommended_time
-
-        # Extract duration (for activities)
-        duration = await self._extract_duration()
-        if duration:
-            data["duration"] = duration
-
-        # Extract dietary options (for restaurants)
-        dietary = await self._extract_dietary_options()
         if dietary:
             data["dietary_options"] = dietary
 
-        # Extract website first (for fallback)
-        website = await self._extract_website()
         if website:
             data["website"] = website
 
-        # Extract tickets/reservation link (unified)
-        tickets_link = await self._extract_tickets_or_reservations_link()
         if tickets_link:
             data["tickets_link"] = tickets_link
         elif website:
             # Use website as fallback
             data["tickets_link"] = website
 
-        # Extract tags
-        tags = await self._extract_tags()
+        # Hours clicks the expand button, so it stays out of the gather
+        # to avoid interleaving page mutations with other extractions
+        hours = await self._extract_hours()
+        if hours:
+            data["hours"] = hours
+            data["closed_days"] = self._get_closed_days(hours)
+
+        # Derived fields reuse the memoized description/category, so this
+        # gather costs at most one extra round trip (duration's body scan)
+        price_range, recommended_time, duration, tags = await asyncio.gather(
+            self._extract_price_range(),
+            self._extract_recommended_time(),
+            self._extract_duration(),
+            self._extract_tags(),
+        )
+
+        if price_range:
+            data["price_range"] = price_range
+
+        if recommended_time:
+            data["recommended_time"] = recommended_time
+
+        if duration:
+            data["duration"] = duration
+
         if tags:
             data["tags"] = tags
 
-        # Extract images
+        # Images click open the photo gallery, so they run last once all
+        # DOM-dependent extractions are done
         images = await self._extract_images()
         if images:
             data["images"] = images
@@ -118,8 +221,13 @@ class DetailScraper:
 
     def _extract_coordinates_from_url(self, url: str) -> Optional[Tuple[float, float]]:
         """Extract latitude and longitude from Google Maps URL."""
+        # Cheap containment check skips the regex engine entirely for
+        # URLs that cannot carry coordinates (e.g. goo.gl short links)
+        if '@' not in url and '!3d' not in url:
+            return None
+
         try:
-            match = re.search(PATTERNS["coordinates_url"], url)
+            match = PATTERNS["coordinates_url"].search(url)
             if match:
                 lat = float(match.group(1))
                 lng = float(match.group(2))
@@ -132,9 +240,12 @@ class DetailScraper:
     async def _extract_coordinates_from_page(self) -> Optional[Tuple[float, float]]:
         """Extract coordinates from page data or meta tags."""
         try:
-            # Try to get coordinates from page URL after any redirects
+            # Try to get coordinates from page URL after any redirects;
+            # same cheap pre-check before touching the regexes
             current_url = self.page.url
-            match = re.search(r'!3d(-?\d+\.\d+)!4d(-?\d+\.\d+)', current_url)
+            match = None
+            if '!3d' in current_url:
+                match = _COORDS_3D4D_RE.search(current_url)
             if match:
                 lat = float(match.group(1))
                 lng = float(match.group(2))
@@ -142,7 +253,7 @@ class DetailScraper:
                 return (lat, lng)
 
             # Try another URL format
-            match = re.search(r'@(-?\d+\.\d+),(-?\d+\.\d+)', current_url)
+            match = _COORDS_AT_RE.search(current_url) if '@' in current_url else None
             if match:
                 lat = float(match.group(1))
                 lng = float(match.group(2))
@@ -164,6 +275,47 @@ class DetailScraper:
 
         return None
 
+    async def _prime_cache(self):
+        """
+        Bulk-extract all static fields in a single page.evaluate.
+
+        After networkidle the HTML is settled, so one in-process DOM walk
+        can resolve every combined selector at once instead of paying a
+        browser round trip per field. Text fields are cleaned and seeded
+        into the selector memo; link and tag values are kept raw in
+        self._primed for their extractors. A failed evaluate just leaves
+        both empty, and the per-field fallback paths still work.
+        """
+        pairs = [
+            [key, SELECTORS_COMBINED[key], attribute]
+            for key, attribute in _PRIME_FIELDS
+            if key in SELECTORS_COMBINED
+        ]
+        try:
+            values = await self.page.evaluate(
+                """pairs => {
+                    const out = {};
+                    for (const [key, sel, attr] of pairs) {
+                        const el = document.querySelector(sel);
+                        out[key] = el ? (attr ? el.getAttribute(attr) : el.innerText) : null;
+                    }
+                    return out;
+                }""",
+                pairs,
+            )
+        except Exception as e:
+            log.debug(f"Failed to prime extraction cache: {e}")
+            return
+
+        for key, attribute in _PRIME_FIELDS:
+            value = values.get(key)
+            if value is None:
+                continue
+            self._primed[key] = value
+            if attribute is None:
+                # Same shape _extract_with_selectors would have stored
+                self._cache[(key, None)] = clean_hebrew_text(value)
+
     async def _extract_with_selectors(self, selector_key: str, attribute: Optional[str] = None) -> Optional[str]:
         """
         Extract text using primary and fallback selectors.
@@ -175,37 +327,37 @@ class DetailScraper:
         Returns:
             Extracted text or None
         """
-        selectors_config = SELECTORS.get(selector_key, {})
-
-        # Try primary selector
-        primary = selectors_config.get("primary")
-        if primary:
+        # Repeat lookups for the same field (description feeds price,
+        # recommended-time and duration) hit the per-page memo, including
+        # negative results so failed selectors don't re-pay their timeout
+        cache_key = (selector_key, attribute)
+        if cache_key in self._cache:
+            return self._cache[cache_key]
+
+        result = None
+
+        # One comma-joined query covers primary and all fallbacks in a
+        # single traversal; only if nothing is attached yet do we pay a
+        # single ELEMENT_WAIT_TIMEOUT instead of one per stale selector
+        combined = SELECTORS_COMBINED.get(selector_key)
+        if combined:
             try:
-                element = await self.page.wait_for_selector(primary, timeout=ELEMENT_WAIT_TIMEOUT, state="attached")
+                element = await self.page.query_selector(combined)
+                if element is None:
+                    element = await self.page.wait_for_selector(
+                        combined, timeout=ELEMENT_WAIT_TIMEOUT, state="attached"
+                    )
                 if element:
                     if attribute:
                         value = await element.get_attribute(attribute)
                     else:
                         value = await element.inner_text()
-                    return clean_hebrew_text(value)
+                    result = clean_hebrew_text(value)
             except (PlaywrightTimeout, Exception) as e:
-                log.debug(f"Primary selector failed for {selector_key}: {e}")
+                log.debug(f"Selector failed for {selector_key}: {e}")
 
-        # Try fallback selectors
-        fallbacks = selectors_config.get("fallback", [])
-        for fallback_selector in fallbacks:
-            try:
-                element = await self.page.wait_for_selector(fallback_selector, timeout=ELEMENT_WAIT_TIMEOUT // 2, state="attached")
-                if element:
-                    if attribute:
-                        value = await element.get_attribute(attribute)
-                    else:
-                        value = await element.inner_text()
-                    return clean_hebrew_text(value)
-            except (PlaywrightTimeout, Exception):
-                continue
-
-        return None
+        self._cache[cache_key] = result
+        return result
 
     async def _extract_name(self) -> Optional[str]:
         """Extract attraction name."""
@@ -246,40 +398,16 @@ class DetailScraper:
             return address
 
         # Remove postal codes (Japanese format: 〒123-4567)
-        address_clean = re.sub(r'〒\d{3}-?\d{4}\s*', '', address)
-
-        # Map of cities to Hebrew names
-        city_mapping = {
-            'Tokyo': 'טוקיו',
-            'tokyo': 'טוקיו',
-            '東京': 'טוקיו',
-            'Osaka': 'אוסקה',
-            'osaka': 'אוסקה',
-            '大阪': 'אוסקה',
-            'Kyoto': 'קיוטו',
-            'kyoto': 'קיוטו',
-            '京都': 'קיוטו',
-            'Yokohama': 'יוקוהמה',
-            'yokohama': 'יוקוהמה',
-            '横浜': 'יוקוהמה',
-        }
+        address_clean = _POSTAL_JP_RE.sub('', address)
 
-        # Check for explicit city names first
-        for city_name, hebrew_name in city_mapping.items():
-            if city_name in address:
-                return hebrew_name
-
-        # Tokyo neighborhoods that should be normalized to Tokyo
-        tokyo_areas = ['Shibuya', 'Shinjuku', 'Chiyoda', 'Minato', 'Chūō', 'Chuo',
-                       'Taitō', 'Taito', 'Sumida', 'Kōtō', 'Koto', 'Shinagawa',
-                       'Meguro', 'Ōta', 'Ota', 'Setagaya', 'Nakano', 'Suginami',
-                       'Toshima', 'Kita', 'Arakawa', 'Itabashi', 'Nerima', 'Adachi',
-                       'Katsushika', 'Edogawa']
+        # Check for explicit city names first (one alternation pass)
+        match = _CITY_RE.search(address)
+        if match:
+            return _CITY_MAPPING[match.group(0)]
 
         # Only normalize to Tokyo if it's a known Tokyo neighborhood
-        for area in tokyo_areas:
-            if area in address:
-                return 'טוקיו'
+        if _TOKYO_RE.search(address):
+            return 'טוקיו'
 
         # Try to extract city from comma-separated parts
         parts = address_clean.split(',')
@@ -288,11 +416,11 @@ class DetailScraper:
             for i in range(len(parts) - 1, -1, -1):
                 part = parts[i].strip()
                 # Skip if it's too short, all digits, or looks like a country
-                if len(part) > 3 and not part.isdigit() and part not in ['Japan', 'Japan']:
+                if len(part) > 3 and not part.isdigit() and part != 'Japan':
                     # Check if this part contains a known city
-                    for city_name, hebrew_name in city_mapping.items():
-                        if city_name in part:
-                            return hebrew_name
+                    match = _CITY_RE.search(part)
+                    if match:
+                        return _CITY_MAPPING[match.group(0)]
                     # If not a known city but looks valid, return as-is
                     if not any(char.isdigit() for char in part):
                         return part
@@ -324,18 +452,27 @@ class DetailScraper:
         """Extract operating hours."""
         try:
             # Click to expand hours if needed
+            hours_element = None
             hours_button = await self.page.query_selector(SELECTORS["hours_button"]["primary"])
             if hours_button:
                 await hours_button.click()
-                await self.page.wait_for_timeout(500)
+                # Wait for the expanded table itself rather than a fixed
+                # sleep; resolves as soon as the DOM renders it
+                try:
+                    hours_element = await self.page.wait_for_selector(
+                        SELECTORS["hours_content"]["primary"], state="visible", timeout=3000
+                    )
+                except PlaywrightTimeout:
+                    pass
 
             # Get hours table or content
-            hours_element = await self.page.query_selector(SELECTORS["hours_content"]["primary"])
+            if hours_element is None:
+                hours_element = await self.page.query_selector(SELECTORS["hours_content"]["primary"])
             if not hours_element:
                 return None
 
             # Extract hours text
-            hours_text = await hours_element.inner_text()
+            hours_text = _nfc(await hours_element.inner_text())
             hours_dict = self._parse_hours_text(hours_text)
 
             if hours_dict:
@@ -374,23 +511,24 @@ class DetailScraper:
             if not line:
                 continue
 
-            # Check if it's a day + hours line
-            for hebrew_day, english_day in HEBREW_DAYS.items():
-                if hebrew_day in line:
-                    # Extract time
-                    if is_closed_hebrew(line):
-                        hours_dict[english_day] = "closed"
-                    else:
-                        # Try to find times (HH:MM format)
-                        times = re.findall(r'(\d{1,2}):(\d{2})', line)
-                        if len(times) >= 2:
-                            open_time = f"{times[0][0].zfill(2)}:{times[0][1]}"
-                            close_time = f"{times[1][0].zfill(2)}:{times[1][1]}"
-                            hours_dict[english_day] = {
-                                "open": open_time,
-                                "close": close_time
-                            }
-                    break
+            # One alternation scan finds the day name instead of one
+            # substring check per Hebrew day variant
+            day_match = HEBREW_DAYS_RE.search(line)
+            if day_match:
+                english_day = HEBREW_DAYS[day_match.group(0)]
+                # Extract time
+                if is_closed_hebrew(line):
+                    hours_dict[english_day] = "closed"
+                else:
+                    # Try to find times (HH:MM format)
+                    times = _HHMM_RE.findall(line)
+                    if len(times) >= 2:
+                        open_time = f"{times[0][0].zfill(2)}:{times[0][1]}"
+                        close_time = f"{times[1][0].zfill(2)}:{times[1][1]}"
+                        hours_dict[english_day] = {
+                            "open": open_time,
+                            "close": close_time
+                        }
 
         return hours_dict if hours_dict else None
 
@@ -409,13 +547,12 @@ class DetailScraper:
             if popular_times:
                 # This is complex - popular times are shown as graphs
                 # For now, we'll extract text and look for day names
-                text = await popular_times.inner_text()
+                text = _nfc(await popular_times.inner_text())
 
-                busy_days = []
-                for hebrew_day, english_day in HEBREW_DAYS.items():
-                    if hebrew_day in text:
-                        # Simple heuristic: if the day is mentioned in popular times, it's busy
-                        busy_days.append(english_day)
+                # Simple heuristic: any day mentioned in popular times is
+                # busy; one alternation pass instead of a scan per variant
+                found = {HEBREW_DAYS[name] for name in HEBREW_DAYS_RE.findall(text)}
+                busy_days = [day for day in ENGLISH_TO_HEBREW_DAYS if day in found]
 
                 if busy_days:
                     log.debug(f"Extracted busy days: {busy_days}")
@@ -456,9 +593,12 @@ class DetailScraper:
                 log.debug(f"Extracted duration: {duration} minutes")
                 return duration
 
-        # Check in other text elements
+        # Check in other text elements, scoped to the place panel instead
+        # of shipping the whole body text over the wire
         try:
-            page_text = await self.page.inner_text('body')
+            page_text = await self.page.eval_on_selector_all(
+                "div[role='main']", "els => els.map(e => e.innerText).join(' ')"
+            )
             duration = parse_duration_hebrew(page_text)
             if duration:
                 log.debug(f"Extracted duration from page: {duration} minutes")
@@ -476,20 +616,12 @@ class DetailScraper:
             # Look for dietary/dining options section
             dietary_element = await self.page.query_selector(SELECTORS["dietary"]["primary"])
             if dietary_element:
-                text = await dietary_element.inner_text()
-                text_lower = text.lower()
-
-                # Check for common dietary options
-                if any(word in text_lower for word in ['vegan', 'טבעוני', 'טבעונית']):
-                    dietary_options.append('vegan')
-                if any(word in text_lower for word in ['vegetarian', 'צמחוני', 'צמחונית']):
-                    dietary_options.append('vegetarian')
-                if any(word in text_lower for word in ['kosher', 'כשר', 'כשרה']):
-                    dietary_options.append('kosher')
-                if any(word in text_lower for word in ['gluten-free', 'ללא גלוטן']):
-                    dietary_options.append('gluten-free')
-                if any(word in text_lower for word in ['halal', 'חלאל']):
-                    dietary_options.append('halal')
+                text = _nfc(await dietary_element.inner_text())
+
+                # One alternation pass over the text replaces a substring
+                # scan per keyword; labels come out in canonical order
+                found = {_DIETARY_KEYWORDS[m] for m in _DIETARY_RE.findall(text.lower())}
+                dietary_options = [label for label in _DIETARY_LABELS if label in found]
 
         except Exception as e:
             log.debug(f"Failed to extract dietary options: {e}")
@@ -500,14 +632,17 @@ class DetailScraper:
 
     async def _extract_website(self) -> Optional[str]:
         """Extract website URL."""
+        link = self._primed.get("website")
+        if link:
+            log.debug(f"Extracted website: {link}")
+            return link
+
         try:
-            website_element = await self.page.query_selector(SELECTORS["website"]["primary"])
-            if not website_element:
-                # Try fallback
-                for fallback in SELECTORS["website"]["fallback"]:
-                    website_element = await self.page.query_selector(fallback)
-                    if website_element:
-                        break
+            website_element = None
+            for selector in SELECTORS_FLAT["website"]:
+                website_element = await self.page.query_selector(selector)
+                if website_element:
+                    break
 
             if website_element:
                 link = await website_element.get_attribute('href')
@@ -522,15 +657,18 @@ class DetailScraper:
 
     async def _extract_tickets_or_reservations_link(self) -> Optional[str]:
         """Extract tickets/reservation link (works for both restaurants and activities)."""
+        link = self._primed.get("book_tickets") or self._primed.get("reserve_table")
+        if link:
+            log.debug(f"Extracted tickets link: {link}")
+            return link
+
         try:
             # Try tickets first
-            tickets_element = await self.page.query_selector(SELECTORS["book_tickets"]["primary"])
-            if not tickets_element:
-                # Try fallback
-                for fallback in SELECTORS["book_tickets"]["fallback"]:
-                    tickets_element = await self.page.query_selector(fallback)
-                    if tickets_element:
-                        break
+            tickets_element = None
+            for selector in SELECTORS_FLAT["book_tickets"]:
+                tickets_element = await self.page.query_selector(selector)
+                if tickets_element:
+                    break
 
             if tickets_element:
                 link = await tickets_element.get_attribute('href')
@@ -539,13 +677,11 @@ class DetailScraper:
                     return link
 
             # Try reservations
-            reserve_element = await self.page.query_selector(SELECTORS["reserve_table"]["primary"])
-            if not reserve_element:
-                # Try fallback
-                for fallback in SELECTORS["reserve_table"]["fallback"]:
-                    reserve_element = await self.page.query_selector(fallback)
-                    if reserve_element:
-                        break
+            reserve_element = None
+            for selector in SELECTORS_FLAT["reserve_table"]:
+                reserve_element = await self.page.query_selector(selector)
+                if reserve_element:
+                    break
 
             if reserve_element:
                 link = await reserve_element.get_attribute('href')
@@ -563,12 +699,16 @@ class DetailScraper:
         tags = []
 
         try:
-            # Try to get review tags
-            review_tags_element = await self.page.query_selector(SELECTORS["review_tags"]["primary"])
-            if review_tags_element:
-                text = await review_tags_element.inner_text()
+            # Try to get review tags (primed value skips the round trip)
+            text = self._primed.get("review_tags")
+            if text is None:
+                review_tags_element = await self.page.query_selector(SELECTORS["review_tags"]["primary"])
+                if review_tags_element:
+                    text = await review_tags_element.inner_text()
+
+            if text:
                 # Split by common separators
-                tag_list = [tag.strip() for tag in re.split(r'[,•·]', text) if tag.strip()]
+                tag_list = [tag.strip() for tag in _TAG_SEP_RE.split(text) if tag.strip()]
                 tags.extend(tag_list[:10])  # Limit to 10 tags
 
         except Exception as e:
@@ -586,30 +726,52 @@ class DetailScraper:
 
         return None
 
+    async def _image_srcs(self) -> List[str]:
+        """Fetch up to MAX_IMAGES googleusercontent srcs in one evaluate."""
+        return await self.page.eval_on_selector_all(
+            SELECTORS["images"]["primary"],
+            "(els, limit) => els.map(e => e.getAttribute('src'))"
+            ".filter(s => s && s.includes('googleusercontent'))"
+            ".slice(0, limit)",
+            MAX_IMAGES,
+        )
+
     async def _extract_images(self) -> Optional[List[str]]:
         """Extract image URLs."""
         images = []
 
         try:
-            # Click on photos to open gallery (if available)
-            photos_button = await self.page.query_selector(SELECTORS["images_container"]["primary"])
-            if photos_button:
-                await photos_button.click()
-                await self.page.wait_for_timeout(1000)
-
-            # Get all image elements
-            image_elements = await self.page.query_selector_all(SELECTORS["images"]["primary"])
-
-            for img_element in image_elements[:MAX_IMAGES]:
-                try:
-                    src = await img_element.get_attribute('src')
-                    if src and 'googleusercontent' in src:
-                        # Get high-res version by modifying URL parameters
-                        high_res_url = re.sub(r'=w\d+-h\d+', '=w1200-h800', src)
-                        if high_res_url not in images:
-                            images.append(high_res_url)
-                except Exception:
-                    continue
+            # The collapsed panel often already exposes enough srcs; only
+            # open the gallery when it doesn't
+            srcs = await self._image_srcs()
+
+            if len(srcs) < MAX_IMAGES:
+                # Click on photos to open gallery (if available)
+                photos_button = await self.page.query_selector(SELECTORS["images_container"]["primary"])
+                if photos_button:
+                    count_before = await self.page.evaluate(
+                        "sel => document.querySelectorAll(sel).length",
+                        SELECTORS["images"]["primary"],
+                    )
+                    await photos_button.click()
+                    # Wait until the gallery actually adds images instead
+                    # of sleeping; a timeout just means no gallery opened
+                    try:
+                        await self.page.wait_for_function(
+                            "([sel, prev]) => document.querySelectorAll(sel).length > prev",
+                            arg=[SELECTORS["images"]["primary"], count_before],
+                            timeout=5000,
+                        )
+                    except PlaywrightTimeout:
+                        pass
+
+                    srcs = await self._image_srcs()
+
+            for src in srcs:
+                # Get high-res version by modifying URL parameters
+                high_res_url = _IMG_RES_RE.sub('=w1200-h800', src)
+                if high_res_url not in images:
+                    images.append(high_res_url)
 
         except Exception as e:
             log.debug(f"Failed to extract images: {e}")
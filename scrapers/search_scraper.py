@@ -1,12 +1,27 @@
 """
 Scraper for discovering attractions by searching Google Maps.
 """
+import asyncio
+import time
 import urllib.parse
+from collections import OrderedDict
 from typing import List, Dict
 from playwright.async_api import Page, TimeoutError as PlaywrightTimeout
 from utils.logger import log
 from config.selectors import SELECTORS
-from config.settings import GOOGLE_MAPS_SEARCH_URL, MAX_SEARCH_RESULTS, ELEMENT_WAIT_TIMEOUT
+from config.settings import (
+    GOOGLE_MAPS_SEARCH_URL,
+    MAX_SEARCH_RESULTS,
+    ELEMENT_WAIT_TIMEOUT,
+    SEARCH_CACHE_SIZE,
+    SEARCH_CACHE_TTL,
+)
+
+
+# TTL-bounded LRU of (city, type) -> result URLs, shared across scraper
+# instances (one is created per query), mirroring utils.url_cache. Repeat
+# queries within the TTL skip the whole navigate/scroll/extract cycle.
+_search_cache: OrderedDict = OrderedDict()
 
 
 class SearchScraper:
@@ -27,16 +42,28 @@ class SearchScraper:
             List of Google Maps URLs
         """
         query = f"{attraction_type} in {city}"
+
+        cache_key = (city, attraction_type)
+        cached = _search_cache.get(cache_key)
+        if cached is not None:
+            stored_at, urls = cached
+            if time.monotonic() - stored_at <= SEARCH_CACHE_TTL:
+                _search_cache.move_to_end(cache_key)
+                log.info(f"Search cache hit for: {query}")
+                return list(urls)
+            del _search_cache[cache_key]
+
         log.info(f"Searching for: {query}")
 
         # Build search URL
         encoded_query = urllib.parse.quote(query)
         search_url = f"{GOOGLE_MAPS_SEARCH_URL}{encoded_query}"
 
-        # Navigate to search page
+        # Navigate to search page; domcontentloaded is enough because the
+        # explicit results wait below covers the dynamic render, while
+        # networkidle would also wait out analytics beacons
         try:
-            await self.page.goto(search_url, wait_until="networkidle", timeout=30000)
-            await self.page.wait_for_timeout(2000)
+            await self.page.goto(search_url, wait_until="domcontentloaded", timeout=30000)
         except Exception as e:
             log.error(f"Failed to navigate to search page: {e}")
             return []
@@ -55,7 +82,16 @@ class SearchScraper:
         urls = await self._extract_urls()
 
         log.info(f"Found {len(urls)} attractions for query: {query}")
-        return urls[:MAX_SEARCH_RESULTS]
+        urls = urls[:MAX_SEARCH_RESULTS]
+
+        # Empty results are not cached, so transient failures retry
+        if urls:
+            _search_cache[cache_key] = (time.monotonic(), list(urls))
+            _search_cache.move_to_end(cache_key)
+            while len(_search_cache) > SEARCH_CACHE_SIZE:
+                _search_cache.popitem(last=False)
+
+        return urls
 
     async def _scroll_results(self):
         """Scroll through search results to load more items."""
@@ -64,10 +100,35 @@ class SearchScraper:
             results_container = await self.page.query_selector(SELECTORS["search_results"]["primary"])
 
             if results_container:
-                # Scroll multiple times to load more results
-                for _ in range(5):  # Scroll 5 times
-                    await results_container.evaluate("el => el.scrollBy(0, el.scrollHeight)")
-                    await self.page.wait_for_timeout(1000)
+                # The whole scroll loop runs inside the page: a
+                # MutationObserver re-scrolls after each batch of new
+                # children and resolves once the list stays quiet for
+                # 300ms, 15 scrolls were done, or 10s elapsed. One round
+                # trip instead of a Python-side scroll/poll cycle.
+                await results_container.evaluate("""
+                    el => new Promise(resolve => {
+                        const deadline = Date.now() + 10000;
+                        let iterations = 0;
+                        let settle = null;
+                        const finish = () => {
+                            observer.disconnect();
+                            clearTimeout(settle);
+                            resolve();
+                        };
+                        const observer = new MutationObserver(() => {
+                            clearTimeout(settle);
+                            if (++iterations >= 15 || Date.now() > deadline) {
+                                finish();
+                                return;
+                            }
+                            el.scrollBy(0, el.scrollHeight);
+                            settle = setTimeout(finish, 300);
+                        });
+                        observer.observe(el, { childList: true, subtree: true });
+                        el.scrollBy(0, el.scrollHeight);
+                        settle = setTimeout(finish, 300);
+                    })
+                """)
 
                 log.debug("Scrolled through search results")
 
@@ -76,50 +137,62 @@ class SearchScraper:
 
     async def _extract_urls(self) -> List[str]:
         """Extract Google Maps URLs from search results."""
-        urls = []
-
         try:
-            # Find all result items
-            result_elements = await self.page.query_selector_all(SELECTORS["search_result_item"]["primary"])
-
-            for element in result_elements:
-                try:
-                    href = await element.get_attribute('href')
-                    if href and '/maps/place/' in href:
-                        # Clean up the URL (remove unnecessary parameters)
-                        clean_url = href.split('?')[0] if '?' in href else href
-                        if clean_url not in urls:
-                            urls.append(clean_url)
-                except Exception:
-                    continue
-
+            # Collect, filter and dedupe every href in one evaluate
+            # instead of one round trip per result element
+            return await self.page.eval_on_selector_all(
+                SELECTORS["search_result_item"]["primary"],
+                "els => Array.from(new Set("
+                "els.map(e => e.getAttribute('href'))"
+                ".filter(h => h && h.includes('/maps/place/'))"
+                ".map(h => h.split('?')[0])))",
+            )
         except Exception as e:
             log.error(f"Failed to extract URLs from search results: {e}")
+            return []
 
-        return urls
-
-    async def search_by_config(self, search_config: Dict) -> Dict[str, List[str]]:
+    async def search_by_config(self, search_config: Dict, concurrency: int = 4) -> Dict[str, List[str]]:
         """
         Search for attractions based on configuration.
 
+        Each (city, type) query runs on its own page from this scraper's
+        browser context, up to `concurrency` at a time, so the
+        network/scroll/extract cycles overlap instead of running serially.
+
         Args:
             search_config: Dictionary with 'cities' and 'types' lists
+            concurrency: Maximum number of concurrent search pages
 
         Returns:
             Dictionary mapping search queries to lists of URLs
         """
-        results = {}
-
         cities = search_config.get('cities', [])
         types = search_config.get('types', [])
+        pairs = [(city, attr_type) for city in cities for attr_type in types]
+
+        semaphore = asyncio.Semaphore(concurrency)
+        context = self.page.context
 
-        for city in cities:
-            for attr_type in types:
-                query_key = f"{city}_{attr_type}"
-                urls = await self.search_attractions(city, attr_type)
-                results[query_key] = urls
+        async def bounded_search(city, attr_type):
+            async with semaphore:
+                page = await context.new_page()
+                try:
+                    return await SearchScraper(page).search_attractions(city, attr_type)
+                finally:
+                    await page.close()
 
-                # Add delay between searches
-                await self.page.wait_for_timeout(3000)
+        # Returned exceptions keep one failed query from cancelling the
+        # rest; they just produce an empty result list
+        search_results = await asyncio.gather(
+            *(bounded_search(city, attr_type) for city, attr_type in pairs),
+            return_exceptions=True,
+        )
+
+        results = {}
+        for (city, attr_type), urls in zip(pairs, search_results):
+            if isinstance(urls, BaseException):
+                log.error(f"Search failed for {city}/{attr_type}: {urls}")
+                urls = []
+            results[f"{city}_{attr_type}"] = urls
 
         return results
@@ -1,127 +1,99 @@
 """
 Browser manager with anti-detection measures for Playwright.
 """
+import asyncio
 import random
 from typing import Optional
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
-from fake_useragent import UserAgent
+from playwright.async_api import async_playwright, BrowserContext, Page, Playwright
 from utils.logger import log
+from utils.browser_pool import (
+    LAUNCH_ARGS,
+    STEALTH_INIT_SCRIPT,
+    STEALTH_HEADERS,
+    _simulate_human_scroll,
+)
 from config.settings import (
     HEADLESS,
     VIEWPORT_WIDTH,
     VIEWPORT_HEIGHT,
     LOCALE,
     TIMEZONE,
-    ACCEPT_LANGUAGE,
     USER_AGENTS,
     PAGE_LOAD_TIMEOUT,
+    USER_DATA_DIR,
 )
 
 
+# Replays precomputed mouse waypoints as mousemove events in-page, so a
+# movement burst costs one round trip instead of one per move plus one
+# per pause
+_MOUSE_MOVEMENT_JS = """
+    async (waypoints) => {
+        for (const [x, y, pause] of waypoints) {
+            document.dispatchEvent(new MouseEvent('mousemove', {
+                clientX: x,
+                clientY: y,
+                bubbles: true,
+            }));
+            await new Promise(r => setTimeout(r, pause));
+        }
+    }
+"""
+
+
 class BrowserManager:
-    """Manages browser instances with anti-detection configuration."""
+    """
+    Manages a single browser instance with anti-detection configuration.
+
+    For concurrent scraping use utils.browser_pool.BrowserPool, which
+    keeps N pre-warmed stealth contexts and recycles them after a use
+    count/age threshold instead of tearing contexts down per restart.
+    This class remains for standalone single-context scripts.
+    """
 
     def __init__(self, headless: bool = HEADLESS):
         self.headless = headless
         self.playwright: Optional[Playwright] = None
-        self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
-        self.ua_generator = UserAgent()
+        self._closed = False
 
     async def start(self):
         """Start the browser with anti-detection measures."""
         log.info("Starting browser...")
+        self._closed = False
 
         self.playwright = await async_playwright().start()
 
-        # Launch browser with anti-detection settings
-        self.browser = await self.playwright.chromium.launch(
-            headless=self.headless,
-            args=[
-                '--disable-blink-features=AutomationControlled',
-                '--disable-dev-shm-usage',
-                '--no-sandbox',
-                '--disable-setuid-sandbox',
-                '--disable-web-security',
-                '--disable-features=IsolateOrigins,site-per-process',
-            ]
-        )
-
-        # Create browser context with stealth settings
-        await self._create_context()
-
-        log.info(f"Browser started (headless={self.headless})")
-
-    async def _create_context(self):
-        """Create a new browser context with anti-detection configuration."""
         # Random viewport size (slight variation)
         viewport_width = VIEWPORT_WIDTH + random.randint(-50, 50)
         viewport_height = VIEWPORT_HEIGHT + random.randint(-50, 50)
 
-        # Random user agent
-        user_agent = random.choice(USER_AGENTS)
-
-        log.debug(f"Creating context with viewport {viewport_width}x{viewport_height}")
-
-        self.context = await self.browser.new_context(
+        # A persistent profile keeps the HTTP cache, cookies and warm
+        # HTTP/2 connections across runs, so repeat visits skip TLS setup
+        # and re-downloading the same Maps CDN assets
+        USER_DATA_DIR.mkdir(parents=True, exist_ok=True)
+        self.context = await self.playwright.chromium.launch_persistent_context(
+            str(USER_DATA_DIR),
+            headless=self.headless,
+            args=LAUNCH_ARGS,
             viewport={'width': viewport_width, 'height': viewport_height},
             locale=LOCALE,
             timezone_id=TIMEZONE,
-            user_agent=user_agent,
+            user_agent=random.choice(USER_AGENTS),
             accept_downloads=False,
             java_script_enabled=True,
-            extra_http_headers={
-                'Accept-Language': ACCEPT_LANGUAGE,
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-            }
+            extra_http_headers=STEALTH_HEADERS,
         )
 
         # Add stealth JavaScript to remove webdriver detection
-        await self.context.add_init_script("""
-            // Remove webdriver flag
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-
-            // Mock plugins
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => [1, 2, 3, 4, 5]
-            });
-
-            // Mock languages
-            Object.defineProperty(navigator, 'languages', {
-                get: () => ['he-IL', 'he', 'en-US', 'en']
-            });
-
-            // Mock platform
-            Object.defineProperty(navigator, 'platform', {
-                get: () => 'Win32'
-            });
-
-            // Mock chrome object
-            window.chrome = {
-                runtime: {}
-            };
-
-            // Mock permissions
-            const originalQuery = window.navigator.permissions.query;
-            window.navigator.permissions.query = (parameters) => (
-                parameters.name === 'notifications' ?
-                    Promise.resolve({ state: Notification.permission }) :
-                    originalQuery(parameters)
-            );
-        """)
-
-        # Create new page
-        self.page = await self.context.new_page()
+        await self.context.add_init_script(STEALTH_INIT_SCRIPT)
+
+        # Persistent contexts start with one blank page; reuse it
+        self.page = self.context.pages[0] if self.context.pages else await self.context.new_page()
         self.page.set_default_timeout(PAGE_LOAD_TIMEOUT)
 
-        log.debug("Browser context created with stealth configuration")
+        log.info(f"Browser started (headless={self.headless})")
 
     async def new_page(self) -> Page:
         """Create a new page in the current context."""
@@ -132,13 +104,21 @@ class BrowserManager:
         page.set_default_timeout(PAGE_LOAD_TIMEOUT)
         return page
 
-    async def navigate(self, url: str, wait_until: str = "networkidle") -> bool:
+    async def navigate(self, url: str, wait_until: str = "domcontentloaded",
+                       wait_for_selector: Optional[str] = None) -> bool:
         """
         Navigate to a URL with error handling.
 
+        Defaults to domcontentloaded rather than networkidle, which waits
+        out 500ms of network silence and stalls on tracker-heavy pages.
+        Callers that need specific content pass its selector instead, and
+        call simulate_human_scroll themselves when anti-bot behavior is
+        worth its two random sleeps.
+
         Args:
             url: URL to navigate to
             wait_until: Wait condition ('load', 'domcontentloaded', 'networkidle')
+            wait_for_selector: Optional selector to await after navigation
 
         Returns:
             True if navigation successful, False otherwise
@@ -147,40 +127,34 @@ class BrowserManager:
             log.info(f"Navigating to: {url}")
             await self.page.goto(url, wait_until=wait_until, timeout=PAGE_LOAD_TIMEOUT)
 
-            # Random scroll to simulate human behavior
-            await self._simulate_human_scroll()
+            if wait_for_selector:
+                await self.page.wait_for_selector(
+                    wait_for_selector, state="visible", timeout=PAGE_LOAD_TIMEOUT
+                )
 
             return True
         except Exception as e:
             log.error(f"Navigation failed: {e}")
             return False
 
-    async def _simulate_human_scroll(self):
-        """Simulate human-like scrolling behavior."""
-        try:
-            # Random small scroll
-            scroll_amount = random.randint(100, 500)
-            await self.page.evaluate(f"window.scrollBy(0, {scroll_amount})")
-            await self.page.wait_for_timeout(random.randint(500, 1500))
-
-            # Scroll back up a bit
-            scroll_back = random.randint(50, 200)
-            await self.page.evaluate(f"window.scrollBy(0, -{scroll_back})")
-            await self.page.wait_for_timeout(random.randint(300, 800))
-
-            log.debug("Simulated human scroll behavior")
-        except Exception as e:
-            log.warning(f"Failed to simulate scroll: {e}")
+    async def simulate_human_scroll(self):
+        """Simulate human-like scrolling behavior (one in-page gesture)."""
+        await _simulate_human_scroll(self.page)
 
     async def random_mouse_movement(self):
         """Simulate random mouse movements."""
         try:
-            # Move mouse to random positions
-            for _ in range(random.randint(2, 4)):
-                x = random.randint(100, VIEWPORT_WIDTH - 100)
-                y = random.randint(100, VIEWPORT_HEIGHT - 100)
-                await self.page.mouse.move(x, y)
-                await self.page.wait_for_timeout(random.randint(100, 300))
+            # Precompute the waypoints and replay them in one evaluate;
+            # the old loop paid a protocol round trip per move and per pause
+            waypoints = [
+                [
+                    random.randint(100, VIEWPORT_WIDTH - 100),
+                    random.randint(100, VIEWPORT_HEIGHT - 100),
+                    random.randint(100, 300),
+                ]
+                for _ in range(random.randint(2, 4))
+            ]
+            await self.page.evaluate(_MOUSE_MOVEMENT_JS, waypoints)
 
             log.debug("Simulated mouse movements")
         except Exception as e:
@@ -195,31 +169,45 @@ class BrowserManager:
             log.error(f"Failed to take screenshot: {e}")
 
     async def restart_context(self):
-        """Restart the browser context (useful after many requests)."""
-        log.info("Restarting browser context...")
+        """Replace the working page (useful after many requests).
 
-        if self.context:
-            await self.context.close()
+        The persistent context itself survives so its HTTP cache and warm
+        connections are kept; only the page (and its JS heap) is recycled.
+        """
+        log.info("Restarting browser page...")
+
+        if self.page:
+            await self.page.close()
 
-        await self._create_context()
+        self.page = await self.context.new_page()
+        self.page.set_default_timeout(PAGE_LOAD_TIMEOUT)
 
-        log.info("Browser context restarted")
+        log.info("Browser page restarted")
 
     async def close(self):
-        """Close the browser and cleanup."""
-        log.info("Closing browser...")
+        """Close the browser and cleanup (safe to call more than once)."""
+        if self._closed:
+            return
+        self._closed = True
 
-        if self.page:
-            await self.page.close()
+        log.info("Closing browser...")
 
         if self.context:
+            # Close all pages in parallel; each close is an independent
+            # CDP round trip, so a context with several pages tears down
+            # in one round-trip time instead of N
+            await asyncio.gather(
+                *(page.close() for page in self.context.pages),
+                return_exceptions=True,
+            )
+            # Closing a persistent context also shuts down its browser
             await self.context.close()
-
-        if self.browser:
-            await self.browser.close()
+            self.context = None
+            self.page = None
 
         if self.playwright:
             await self.playwright.stop()
+            self.playwright = None
 
         log.info("Browser closed")
 
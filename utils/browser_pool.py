@@ -0,0 +1,317 @@
+"""
+Async pool of stealth browser contexts for concurrent scraping.
+
+Each pool entry owns one BrowserContext + Page pair from a single shared
+Chromium instance. Callers borrow a page with `async with pool.acquire()`,
+so up to `max_size` scrapes can run in parallel instead of serializing on
+one global page. Entries are recycled after `max_uses` scrapes or
+`max_age_ms` of lifetime to keep per-context memory growth bounded.
+"""
+import asyncio
+import random
+import time
+from contextlib import asynccontextmanager
+from typing import List, Optional
+
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
+
+from utils.logger import log
+from config.settings import (
+    HEADLESS,
+    VIEWPORT_WIDTH,
+    VIEWPORT_HEIGHT,
+    LOCALE,
+    TIMEZONE,
+    ACCEPT_LANGUAGE,
+    USER_AGENTS,
+    PAGE_LOAD_TIMEOUT,
+    BROWSER_POOL_SIZE,
+    BROWSER_POOL_MAX_USES,
+    BROWSER_POOL_MAX_AGE_MS,
+    BLOCK_HEAVY_RESOURCES,
+)
+
+
+# Resource types aborted when BLOCK_HEAVY_RESOURCES is on. The DOM (and
+# every <img> src attribute) still arrives; only the payload bytes are
+# skipped. Stylesheets stay enabled so visibility-based waits keep working.
+_BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+
+
+async def _abort_heavy_resources(route):
+    """Route handler that drops image/media/font requests."""
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# Launch flags shared with BrowserManager so all contexts behave identically
+LAUNCH_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-web-security',
+    '--disable-features=IsolateOrigins,site-per-process',
+]
+
+# Stealth JavaScript injected into every context (shared with BrowserManager)
+STEALTH_INIT_SCRIPT = """
+    // Remove webdriver flag
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+
+    // Mock plugins
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5]
+    });
+
+    // Mock languages
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['he-IL', 'he', 'en-US', 'en']
+    });
+
+    // Mock platform
+    Object.defineProperty(navigator, 'platform', {
+        get: () => 'Win32'
+    });
+
+    // Mock chrome object
+    window.chrome = {
+        runtime: {}
+    };
+
+    // Mock permissions
+    const originalQuery = window.navigator.permissions.query;
+    window.navigator.permissions.query = (parameters) => (
+        parameters.name === 'notifications' ?
+            Promise.resolve({ state: Notification.permission }) :
+            originalQuery(parameters)
+    );
+"""
+
+
+# One shared headers dict instead of a fresh literal per context; callers
+# must not mutate it
+STEALTH_HEADERS = {
+    'Accept-Language': ACCEPT_LANGUAGE,
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+
+async def navigate(page: Page, url: str, wait_until: str = "networkidle") -> bool:
+    """
+    Navigate a pooled page to a URL with error handling.
+
+    Args:
+        page: Page borrowed from the pool
+        url: URL to navigate to
+        wait_until: Wait condition ('load', 'domcontentloaded', 'networkidle')
+
+    Returns:
+        True if navigation successful, False otherwise
+    """
+    try:
+        log.info(f"Navigating to: {url}")
+        await page.goto(url, wait_until=wait_until, timeout=PAGE_LOAD_TIMEOUT)
+
+        # Random scroll to simulate human behavior
+        await _simulate_human_scroll(page)
+
+        return True
+    except Exception as e:
+        log.error(f"Navigation failed: {e}")
+        return False
+
+
+# Whole scroll gesture runs in-page so the sequence costs one protocol
+# round trip instead of four (two evaluates + two wait_for_timeouts)
+_SCROLL_GESTURE_JS = """
+    async ([down, pause1, up, pause2]) => {
+        window.scrollBy(0, down);
+        await new Promise(r => setTimeout(r, pause1));
+        window.scrollBy(0, -up);
+        await new Promise(r => setTimeout(r, pause2));
+    }
+"""
+
+
+async def _simulate_human_scroll(page: Page):
+    """Simulate human-like scrolling behavior on a pooled page."""
+    try:
+        await page.evaluate(_SCROLL_GESTURE_JS, [
+            random.randint(100, 500),
+            random.randint(500, 1500),
+            random.randint(50, 200),
+            random.randint(300, 800),
+        ])
+        log.debug("Simulated human scroll behavior")
+    except Exception as e:
+        log.warning(f"Failed to simulate scroll: {e}")
+
+
+class PooledContext:
+    """One browser context + page slot tracked by the pool."""
+
+    def __init__(self, context: BrowserContext, page: Page):
+        self.context = context
+        self.page = page
+        self.in_use = False
+        self.created_at = time.monotonic()
+        self.uses = 0
+        # Scraper pinned to this page, built lazily by the first borrower
+        # and retired together with the slot on recycle
+        self.scraper = None
+
+
+class BrowserPool:
+    """Fixed-size pool of stealth browser contexts backed by one Chromium."""
+
+    def __init__(self, max_size: int = BROWSER_POOL_SIZE,
+                 max_uses: int = BROWSER_POOL_MAX_USES,
+                 max_age_ms: int = BROWSER_POOL_MAX_AGE_MS,
+                 headless: bool = HEADLESS):
+        self.max_size = max_size
+        self.max_uses = max_uses
+        self.max_age_ms = max_age_ms
+        self.headless = headless
+        self.playwright: Optional[Playwright] = None
+        self.browser: Optional[Browser] = None
+        self._entries: List[PooledContext] = []
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._semaphore = asyncio.Semaphore(max_size)
+        # Cookies/localStorage harvested from retired contexts, so fresh
+        # contexts skip Google's consent banner instead of re-clearing it
+        self._storage_state = None
+
+    @property
+    def ready(self) -> bool:
+        """True once the pool has been initialized."""
+        return self.browser is not None
+
+    async def init(self):
+        """Launch the browser and pre-create all pool entries."""
+        log.info(f"Starting browser pool (size={self.max_size})...")
+
+        self.playwright = await async_playwright().start()
+        self.browser = await self.playwright.chromium.launch(
+            headless=self.headless,
+            args=LAUNCH_ARGS,
+        )
+
+        for _ in range(self.max_size):
+            entry = await self._create_entry()
+            self._entries.append(entry)
+            self._idle.put_nowait(entry)
+
+        log.info(f"Browser pool started with {self.max_size} contexts (headless={self.headless})")
+
+    async def _create_entry(self) -> PooledContext:
+        """Create one stealth context + page pair."""
+        # Random viewport size (slight variation)
+        viewport_width = VIEWPORT_WIDTH + random.randint(-50, 50)
+        viewport_height = VIEWPORT_HEIGHT + random.randint(-50, 50)
+
+        context = await self.browser.new_context(
+            storage_state=self._storage_state,
+            viewport={'width': viewport_width, 'height': viewport_height},
+            locale=LOCALE,
+            timezone_id=TIMEZONE,
+            user_agent=random.choice(USER_AGENTS),
+            accept_downloads=False,
+            java_script_enabled=True,
+            extra_http_headers=STEALTH_HEADERS,
+        )
+        await context.add_init_script(STEALTH_INIT_SCRIPT)
+
+        if BLOCK_HEAVY_RESOURCES:
+            await context.route("**/*", _abort_heavy_resources)
+
+        page = await context.new_page()
+        page.set_default_timeout(PAGE_LOAD_TIMEOUT)
+
+        return PooledContext(context, page)
+
+    def _expired(self, entry: PooledContext) -> bool:
+        """Check if an entry should be recycled before its next use."""
+        if entry.uses >= self.max_uses:
+            return True
+        age_ms = (time.monotonic() - entry.created_at) * 1000
+        return age_ms >= self.max_age_ms
+
+    async def _recycle(self, entry: PooledContext) -> PooledContext:
+        """Replace a worn-out entry with a fresh context."""
+        log.debug(f"Recycling pool context after {entry.uses} uses")
+        try:
+            # Carry the session (consent cookies etc.) over to successors
+            self._storage_state = await entry.context.storage_state()
+        except Exception as e:
+            log.debug(f"Failed to capture storage state: {e}")
+        try:
+            await entry.context.close()
+        except Exception as e:
+            log.warning(f"Failed to close recycled context: {e}")
+
+        fresh = await self._create_entry()
+        self._entries[self._entries.index(entry)] = fresh
+        return fresh
+
+    @asynccontextmanager
+    async def acquire_entry(self):
+        """Borrow a full pool entry (page + pinned scraper slot)."""
+        await self._semaphore.acquire()
+        entry = None
+        try:
+            entry = await self._idle.get()
+            if self._expired(entry):
+                entry = await self._recycle(entry)
+            entry.in_use = True
+        except BaseException:
+            # Give the slot back before re-raising; otherwise a failed
+            # recycle permanently shrinks the pool and, once every slot
+            # is lost, acquire blocks forever. The returned entry may be
+            # worn out, but a later acquire just retries the recycle.
+            if entry is not None:
+                self._idle.put_nowait(entry)
+            self._semaphore.release()
+            raise
+        try:
+            yield entry
+        finally:
+            entry.in_use = False
+            entry.uses += 1
+            self._idle.put_nowait(entry)
+            self._semaphore.release()
+
+    @asynccontextmanager
+    async def acquire(self):
+        """Borrow a page from the pool for the duration of one scrape."""
+        async with self.acquire_entry() as entry:
+            yield entry.page
+
+    async def close(self):
+        """Close all contexts and the shared browser."""
+        log.info("Closing browser pool...")
+
+        for entry in self._entries:
+            try:
+                await entry.context.close()
+            except Exception as e:
+                log.warning(f"Failed to close pool context: {e}")
+        self._entries.clear()
+
+        if self.browser:
+            await self.browser.close()
+            self.browser = None
+
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
+
+        log.info("Browser pool closed")
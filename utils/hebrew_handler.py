@@ -3,10 +3,73 @@ Utilities for handling Hebrew text.
 """
 import unicodedata
 import re
+from array import array
+from functools import lru_cache
 from typing import Optional
 from utils.logger import log
 
 
+# Keyword scanners compiled once at import; each helper then does one
+# linear pass instead of a substring check per keyword
+_CLOSED_RE = re.compile('|'.join(map(re.escape, ['סגור', 'סגורה', 'סגורים', 'closed'])))
+
+_TIME_OF_DAY_KEYWORDS = {
+    'בוקר': 'morning', 'הבוקר': 'morning',
+    'צהריים': 'lunch', 'הצהריים': 'lunch', 'ארוחת צהריים': 'lunch',
+    'אחר הצהריים': 'afternoon', 'אחה"צ': 'afternoon',
+    'ערב': 'evening', 'הערב': 'evening', 'ערבית': 'evening',
+    'לילה': 'night', 'הלילה': 'night',
+}
+# Longest keywords first so 'אחר הצהריים' wins over its 'צהריים' substring
+_TIME_OF_DAY_RE = re.compile('|'.join(
+    map(re.escape, sorted(_TIME_OF_DAY_KEYWORDS, key=len, reverse=True))))
+_TIME_OF_DAY_ORDER = ('morning', 'lunch', 'afternoon', 'evening', 'night')
+
+_DURATION_HOURS_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(?:שעות|שעה|hours?)')
+_DURATION_MINUTES_RE = re.compile(r'(\d+)\s*(?:דקות|דקה|minutes?)')
+
+# Hebrew Unicode range: \u0590-\u05FF
+_HEBREW_RE = re.compile(r'[\u0590-\u05FF]')
+_NUMBERS_RE = re.compile(r'\d+')
+
+_PRICE_KEYWORDS = {
+    '\u05D7\u05D9\u05E0\u05DD': 'free', '\u05DC\u05DC\u05D0 \u05EA\u05E9\u05DC\u05D5\u05DD': 'free', '\u05D1\u05D7\u05D9\u05E0\u05DD': 'free', 'free': 'free',
+    '\u05D9\u05E7\u05E8': 'expensive', '\u05D9\u05E7\u05E8\u05D4': 'expensive', '\u05D9\u05E7\u05E8\u05D9\u05DD': 'expensive',
+    'expensive': 'expensive',
+    '\u05D6\u05D5\u05DC': 'cheap', '\u05D6\u05D5\u05DC\u05D4': 'cheap', '\u05D6\u05D5\u05DC\u05D9\u05DD': 'cheap',
+    'cheap': 'cheap', 'inexpensive': 'cheap',
+}
+_PRICE_RE = re.compile('|'.join(
+    map(re.escape, sorted(_PRICE_KEYWORDS, key=len, reverse=True))))
+
+
+_SHEKEL_UTF8 = '₪'.encode('utf-8')
+
+# Matches any text that ' '.join(text.split()) would actually change:
+# leading/trailing whitespace, runs of two, or whitespace other than ' '
+_WS_DIRTY_RE = re.compile(r'^\s|\s\s|\s$|[^\S ]')
+
+
+class _ControlCharTable(dict):
+    """
+    str.translate table that deletes control characters (category C)
+    except newline and tab.
+
+    Populated lazily per codepoint, so translate runs in the C string
+    loop and unicodedata.category is consulted once per distinct
+    character ever seen rather than once per character per call.
+    """
+
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        value = None if (unicodedata.category(char)[0] == 'C' and char not in '\n\t') else codepoint
+        self[codepoint] = value
+        return value
+
+
+_CONTROL_TBL = _ControlCharTable()
+
+
 def normalize_hebrew(text: Optional[str]) -> Optional[str]:
     """
     Normalize Hebrew text to ensure consistent encoding.
@@ -20,11 +83,17 @@ def normalize_hebrew(text: Optional[str]) -> Optional[str]:
     if not text:
         return text
 
-    # Normalize to NFC (Canonical Decomposition followed by Canonical Composition)
-    normalized = unicodedata.normalize('NFC', text)
+    # Normalize to NFC (Canonical Decomposition followed by Canonical
+    # Composition); ASCII is NFC by construction, and is_normalized
+    # short-circuits the common already-NFC case for everything else
+    if text.isascii() or unicodedata.is_normalized('NFC', text):
+        normalized = text
+    else:
+        normalized = unicodedata.normalize('NFC', text)
 
-    # Remove extra whitespace
-    normalized = ' '.join(normalized.split())
+    # Remove extra whitespace, skipping the copy when there is none
+    if _WS_DIRTY_RE.search(normalized):
+        normalized = ' '.join(normalized.split())
 
     return normalized
 
@@ -42,12 +111,10 @@ def contains_hebrew(text: str) -> bool:
     if not text:
         return False
 
-    # Hebrew Unicode range: \u0590-\u05FF
-    hebrew_pattern = re.compile(r'[\u0590-\u05FF]')
-    return bool(hebrew_pattern.search(text))
+    return bool(_HEBREW_RE.search(text))
 
 
-def extract_numbers_from_hebrew(text: str) -> list[int]:
+def extract_numbers_from_hebrew(text: str) -> array:
     """
     Extract numbers from text that may contain Hebrew.
 
@@ -55,20 +122,26 @@ def extract_numbers_from_hebrew(text: str) -> list[int]:
         text: Input text string
 
     Returns:
-        List of extracted numbers
+        array.array('q') of extracted numbers; iterates like a list of
+        ints but stores them as packed 64-bit values
     """
     if not text:
-        return []
+        return array('q')
 
-    # Find all numbers (including decimals)
-    numbers = re.findall(r'\d+', text)
-    return [int(n) for n in numbers]
+    # finditer feeds the array directly without an intermediate list of
+    # match strings; 'q' (not 'i') so long digit runs like phone numbers
+    # don't overflow
+    return array('q', (int(m.group()) for m in _NUMBERS_RE.finditer(text)))
 
 
+@lru_cache(maxsize=8192)
 def clean_hebrew_text(text: Optional[str]) -> Optional[str]:
     """
     Clean and prepare Hebrew text for storage.
 
+    Memoized: cities, categories, tags and day names repeat across
+    attractions, so most calls after the first are dict lookups.
+
     Args:
         text: Input text string
 
@@ -82,7 +155,7 @@ def clean_hebrew_text(text: Optional[str]) -> Optional[str]:
     cleaned = normalize_hebrew(text)
 
     # Remove control characters but preserve newlines and tabs
-    cleaned = ''.join(char for char in cleaned if unicodedata.category(char)[0] != 'C' or char in '\n\t')
+    cleaned = cleaned.translate(_CONTROL_TBL)
 
     # Remove leading/trailing whitespace
     cleaned = cleaned.strip()
@@ -90,6 +163,18 @@ def clean_hebrew_text(text: Optional[str]) -> Optional[str]:
     return cleaned if cleaned else None
 
 
+def _detect_time_of_day(folded: str) -> Optional[str]:
+    """Time-of-day detection over already-casefolded text."""
+    # One alternation pass; longest-first matching means 'אחר הצהריים'
+    # counts as afternoon rather than leaking its 'צהריים' substring
+    hits = {_TIME_OF_DAY_KEYWORDS[match] for match in _TIME_OF_DAY_RE.findall(folded)}
+    for time_of_day in _TIME_OF_DAY_ORDER:
+        if time_of_day in hits:
+            return time_of_day
+
+    return None
+
+
 def detect_time_of_day_hebrew(text: str) -> Optional[str]:
     """
     Detect recommended time of day from Hebrew text.
@@ -103,21 +188,7 @@ def detect_time_of_day_hebrew(text: str) -> Optional[str]:
     if not text:
         return None
 
-    text_lower = text.lower()
-
-    # Hebrew time keywords
-    if any(word in text_lower for word in ['בוקר', 'הבוקר']):
-        return 'morning'
-    elif any(word in text_lower for word in ['צהריים', 'הצהריים', 'ארוחת צהריים']):
-        return 'lunch'
-    elif any(word in text_lower for word in ['אחר הצהריים', 'אחה"צ']):
-        return 'afternoon'
-    elif any(word in text_lower for word in ['ערב', 'הערב', 'ערבית']):
-        return 'evening'
-    elif any(word in text_lower for word in ['לילה', 'הלילה']):
-        return 'night'
-
-    return None
+    return _detect_time_of_day(text.casefold())
 
 
 def parse_duration_hebrew(text: str) -> Optional[int]:
@@ -133,15 +204,13 @@ def parse_duration_hebrew(text: str) -> Optional[int]:
     if not text:
         return None
 
-    text_lower = text.lower()
+    return _parse_duration(text.casefold())
 
-    # Pattern for hours (שעות or שעה)
-    hours_pattern = r'(\d+(?:\.\d+)?)\s*(?:שעות|שעה|hours?)'
-    hours_match = re.search(hours_pattern, text_lower)
 
-    # Pattern for minutes (דקות or דקה)
-    minutes_pattern = r'(\d+)\s*(?:דקות|דקה|minutes?)'
-    minutes_match = re.search(minutes_pattern, text_lower)
+def _parse_duration(folded: str) -> Optional[int]:
+    """Duration parsing over already-casefolded text."""
+    hours_match = _DURATION_HOURS_RE.search(folded)
+    minutes_match = _DURATION_MINUTES_RE.search(folded)
 
     total_minutes = 0
 
@@ -169,10 +238,7 @@ def is_closed_hebrew(text: str) -> bool:
     if not text:
         return False
 
-    text_lower = text.lower()
-    closed_keywords = ['סגור', 'סגורה', 'סגורים', 'closed']
-
-    return any(keyword in text_lower for keyword in closed_keywords)
+    return _CLOSED_RE.search(text.casefold()) is not None
 
 
 def extract_price_range_hebrew(text: str) -> Optional[str]:
@@ -188,16 +254,23 @@ def extract_price_range_hebrew(text: str) -> Optional[str]:
     if not text:
         return None
 
-    text_lower = text.lower()
+    return _extract_price_range(text.casefold())
+
+
+def _extract_price_range(folded: str) -> Optional[str]:
+    """Price-range extraction over already-casefolded text."""
+    # One alternation pass over the text covers all three keyword groups;
+    # longest-first matching keeps 'inexpensive' out of the expensive bucket
+    hits = {_PRICE_KEYWORDS[match] for match in _PRICE_RE.findall(folded)}
 
-    # Check for free keywords
-    free_keywords = ['חינם', 'ללא תשלום', 'בחינם', 'free']
-    if any(keyword in text_lower for keyword in free_keywords):
+    if 'free' in hits:
         return 'free'
 
-    # Count ₪ symbols
-    shekel_count = text.count('₪')
-    dollar_count = text.count('$')
+    # Count ₪ symbols; counting over the UTF-8 bytes keeps both scans in
+    # memchr-backed C loops even when the str is stored wide
+    encoded = folded.encode('utf-8')
+    shekel_count = encoded.count(_SHEKEL_UTF8)
+    dollar_count = encoded.count(b'$')
     price_symbols = max(shekel_count, dollar_count)
 
     if price_symbols >= 3:
@@ -205,14 +278,37 @@ def extract_price_range_hebrew(text: str) -> Optional[str]:
     elif price_symbols >= 1:
         return 'cheap'
 
-    # Check for expensive keywords
-    expensive_keywords = ['יקר', 'יקרה', 'יקרים', 'expensive']
-    if any(keyword in text_lower for keyword in expensive_keywords):
+    if 'expensive' in hits:
         return 'expensive'
 
-    # Check for cheap keywords
-    cheap_keywords = ['זול', 'זולה', 'זולים', 'cheap', 'inexpensive']
-    if any(keyword in text_lower for keyword in cheap_keywords):
+    if 'cheap' in hits:
         return 'cheap'
 
     return None
+
+
+def analyze_hebrew_signals(text: Optional[str]) -> dict:
+    """
+    Extract all keyword-based signals from one text in a single pass.
+
+    Casefolds the text once and reuses it for every detector, instead of
+    each helper lowercasing the same string independently.
+
+    Args:
+        text: Input text string
+
+    Returns:
+        Dict with keys 'time_of_day', 'closed', 'price_range' and
+        'duration_min' (values as returned by the individual helpers)
+    """
+    if not text:
+        return {'time_of_day': None, 'closed': False,
+                'price_range': None, 'duration_min': None}
+
+    folded = text.casefold()
+    return {
+        'time_of_day': _detect_time_of_day(folded),
+        'closed': _CLOSED_RE.search(folded) is not None,
+        'price_range': _extract_price_range(folded),
+        'duration_min': _parse_duration(folded),
+    }
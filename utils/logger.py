@@ -6,23 +6,34 @@ from loguru import logger
 from config.settings import LOG_LEVEL, LOG_FORMAT, LOG_FILE, LOG_ROTATION, LOG_RETENTION, LOGS_DIR
 
 
+# Guards against re-running sink setup; loguru state is process-global,
+# so a second call would tear down and rebuild both sinks for nothing
+_configured = False
+
+
 def setup_logger():
-    """Configure the logger with file and console output."""
+    """Configure the logger with file and console output (idempotent)."""
+    global _configured
+    if _configured:
+        return logger
+
     # Ensure logs directory exists
     LOGS_DIR.mkdir(parents=True, exist_ok=True)
 
     # Remove default logger
     logger.remove()
 
-    # Add console logger
+    # Both sinks are enqueued so emitting a record is just a queue put;
+    # formatting and I/O happen on loguru's writer thread instead of
+    # blocking the event loop on stderr/file writes
     logger.add(
         sys.stderr,
         format=LOG_FORMAT,
         level=LOG_LEVEL,
         colorize=True,
+        enqueue=True,
     )
 
-    # Add file logger
     logger.add(
         LOG_FILE,
         format=LOG_FORMAT,
@@ -30,8 +41,10 @@ def setup_logger():
         rotation=LOG_ROTATION,
         retention=LOG_RETENTION,
         encoding="utf-8",
+        enqueue=True,
     )
 
+    _configured = True
     logger.info("Logger initialized")
     return logger
 
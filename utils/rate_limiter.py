@@ -3,6 +3,7 @@ Rate limiting utilities to avoid bot detection.
 """
 import asyncio
 import random
+import time
 from utils.logger import log
 from config.settings import (
     BASE_DELAY_MIN,
@@ -10,36 +11,72 @@ from config.settings import (
     LONG_PAUSE_INTERVAL,
     LONG_PAUSE_MIN,
     LONG_PAUSE_MAX,
+    RATE_LIMIT_BURST,
 )
 
 
 class RateLimiter:
-    """Manages request rate limiting with adaptive delays."""
+    """
+    Coroutine-safe token-bucket rate limiter shared across scrape workers.
 
-    def __init__(self):
+    Tokens refill continuously at `rate` per second up to `capacity`, so a
+    pool of workers respects one aggregate request rate instead of each
+    worker sleeping a fixed delay independently. Short bursts up to
+    `capacity` requests pass without waiting.
+    """
+
+    def __init__(self, rate: float = None, capacity: int = RATE_LIMIT_BURST):
+        # Default rate matches the old average inter-request delay
+        avg_delay = (BASE_DELAY_MIN + BASE_DELAY_MAX) / 2
+        self.base_rate = rate if rate is not None else 1.0 / avg_delay
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
         self.request_count = 0
         self.error_count = 0
         self.delay_multiplier = 1.0
+        self._lock = asyncio.Lock()
+        self._stats = None  # Rebuilt by get_stats when counters change
 
-    async def wait(self):
-        """Apply delay before next request (non-blocking)."""
-        self.request_count += 1
+    @property
+    def rate(self) -> float:
+        """Effective refill rate, slowed by the adaptive multiplier."""
+        return self.base_rate / self.delay_multiplier
+
+    async def acquire(self, n: int = 1):
+        """Take n tokens, sleeping until the bucket has refilled enough."""
+        async with self._lock:
+            self.request_count += 1
+            self._stats = None
+
+            # Refill based on elapsed time
+            now = time.monotonic()
+            self.tokens = min(self.capacity,
+                              self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
 
-        # Determine if we need a long pause
-        if self.request_count % LONG_PAUSE_INTERVAL == 0:
-            delay = random.uniform(LONG_PAUSE_MIN, LONG_PAUSE_MAX)
-            log.info(f"Long pause after {self.request_count} requests: {delay:.1f}s")
-        else:
-            # Normal delay with multiplier for adaptive rate limiting
-            base_delay = random.uniform(BASE_DELAY_MIN, BASE_DELAY_MAX)
-            delay = base_delay * self.delay_multiplier
+            # Deduct now; a negative balance queues us behind earlier waiters
+            self.tokens -= n
+            wait_time = -self.tokens / self.rate if self.tokens < 0 else 0.0
 
-        log.debug(f"Waiting {delay:.2f}s before next request (multiplier: {self.delay_multiplier:.2f}x)")
-        await asyncio.sleep(delay)
+            # Periodic long pause to look less like a bot
+            if self.request_count % LONG_PAUSE_INTERVAL == 0:
+                pause = random.uniform(LONG_PAUSE_MIN, LONG_PAUSE_MAX)
+                log.info(f"Long pause after {self.request_count} requests: {pause:.1f}s")
+                wait_time += pause
+
+        if wait_time > 0:
+            log.debug(f"Waiting {wait_time:.2f}s for rate limit (multiplier: {self.delay_multiplier:.2f}x)")
+            await asyncio.sleep(wait_time)
+
+    async def wait(self):
+        """Apply rate limiting before the next request (non-blocking)."""
+        await self.acquire(1)
 
     def on_error(self):
         """Increase delay on errors (adaptive)."""
         self.error_count += 1
+        self._stats = None
         # Increase multiplier by 50% on each error, max 5x
         self.delay_multiplier = min(self.delay_multiplier * 1.5, 5.0)
         log.warning(f"Error detected. Increasing delay multiplier to {self.delay_multiplier:.2f}x")
@@ -48,6 +85,7 @@ class RateLimiter:
         """Gradually decrease delay on success."""
         # Slowly decrease multiplier back to 1.0
         if self.delay_multiplier > 1.0:
+            self._stats = None
             self.delay_multiplier = max(self.delay_multiplier * 0.9, 1.0)
             log.debug(f"Success. Decreasing delay multiplier to {self.delay_multiplier:.2f}x")
 
@@ -56,13 +94,18 @@ class RateLimiter:
         self.request_count = 0
         self.error_count = 0
         self.delay_multiplier = 1.0
+        self.tokens = float(self.capacity)
+        self.last_refill = time.monotonic()
+        self._stats = None
         log.info("Rate limiter reset")
 
     def get_stats(self) -> dict:
-        """Get rate limiter statistics."""
-        return {
-            "total_requests": self.request_count,
-            "errors": self.error_count,
-            "delay_multiplier": self.delay_multiplier,
-            "error_rate": self.error_count / max(self.request_count, 1),
-        }
+        """Get rate limiter statistics (cached until the counters change)."""
+        if self._stats is None:
+            self._stats = {
+                "total_requests": self.request_count,
+                "errors": self.error_count,
+                "delay_multiplier": self.delay_multiplier,
+                "error_rate": self.error_count / max(self.request_count, 1),
+            }
+        return self._stats
@@ -0,0 +1,59 @@
+"""
+TTL-bounded LRU cache of scraped attraction data, keyed by normalized URL.
+
+Lets repeated scrapes of the same Google Maps URL (within a batch, across
+batches, or via the single-URL endpoint) skip the full Playwright
+navigation and extraction.
+"""
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from config.settings import URL_CACHE_SIZE, URL_CACHE_TTL
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a Google Maps URL into a cache key.
+
+    Drops the query string and fragment (tracking/session parameters) and
+    any trailing slash so equivalent URLs share one entry.
+    """
+    key = url.split('#', 1)[0].split('?', 1)[0]
+    return key.rstrip('/')
+
+
+class ScrapeCache:
+    """LRU cache with per-entry TTL for processed attraction data."""
+
+    def __init__(self, maxsize: int = URL_CACHE_SIZE, ttl: float = URL_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+
+    def get(self, url: str) -> Optional[Dict]:
+        """Return a copy of the cached data for a URL, or None if absent/expired."""
+        key = normalize_url(url)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        data, stored_at = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return dict(data)
+
+    def put(self, url: str, data: Dict):
+        """Store processed data for a URL, evicting the least recently used."""
+        key = normalize_url(url)
+        self._entries[key] = (dict(data), time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+# Shared across the API endpoints and batch scrape workers
+scrape_cache = ScrapeCache()